@@ -0,0 +1,477 @@
+# SPDX-FileCopyrightText: 2023 Jose David Montoya
+#
+# SPDX-License-Identifier: MIT
+"""
+Benchmarks for the dial widgets, run on plain CPython with the headless backend.
+
+Reports dial construction time, needle updates per second for one to several
+needles, and bytes allocated per needle update and per dial. Results are
+compared against ``baseline.json`` and the run fails when a byte or count
+metric regresses past the threshold.
+
+Timings depend on the machine, so they are scaled by a reference loop timed in
+the same run before being compared, and a slower timing is only a warning
+unless ``--strict-timings`` is given.
+
+Usage::
+
+    python benchmarks/dial_benchmark.py            # compare against the baseline
+    python benchmarks/dial_benchmark.py --save     # store a new baseline
+    python benchmarks/dial_benchmark.py --threshold 0.5
+    python benchmarks/dial_benchmark.py --strict-timings
+
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# pylint: disable=wrong-import-position
+from circuitpython_simple_dial import headless
+
+headless.install()
+
+from circuitpython_simple_dial.label_cache import LabelCache
+from circuitpython_simple_dial.simple_dial import Dial, _draw_circle_spans
+from circuitpython_simple_dial.dial_needle import needle
+from circuitpython_simple_dial.sprite_needle import sprite_needle
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# metric name suffixes where a bigger number is the better one
+HIGHER_IS_BETTER = ("_per_s",)
+# metric name suffixes of timings, scaled by the reference loop before comparing
+TIMINGS = ("_s",)
+
+DIAL_SIZES = (150, 240)
+MAX_NEEDLES = 3
+UPDATES = 2000
+
+
+def _best_of(function, repeat=5):
+    # one untimed call first, so the first measurement is not a cold one
+    function()
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def bench_calibration():
+    """Seconds for a fixed pure Python loop, the speed of this machine"""
+
+    def loop():
+        total = 0
+        for i in range(20000):
+            total += (i * 7) % 13
+        return total
+
+    return {"calibration_s": _best_of(loop, repeat=7)}
+
+
+def bench_construction():
+    """Seconds to build a dial, best of five"""
+    results = {}
+    for size in DIAL_SIZES:
+        results["dial_%d_construction_s" % size] = _best_of(
+            lambda size=size: Dial(width=size, height=size, padding=12)
+        )
+    results["dial_240_lazy_construction_s"] = _best_of(
+        lambda: Dial(width=240, height=240, padding=12, lazy=True)
+    )
+    results["dial_240_longest_render_step_s"] = _longest_render_step()
+    dial = Dial(width=240, height=240, padding=12)
+
+    def relabel(dial=dial):
+        dial.major_tick_labels = ("0", "50", "100", "150")
+
+    results["dial_240_relabel_s"] = _best_of(relabel)
+    for rotated in (False, True):
+        labels = LabelCache(max_bytes=16384, rotated=rotated)
+        results[
+            "dial_240_%s_labels_construction_s" % ("rotated" if rotated else "cached")
+        ] = _best_of(
+            lambda labels=labels: Dial(
+                width=240, height=240, padding=12, label_cache=labels
+            )
+        )
+    return results
+
+
+def _longest_render_step():
+    # longest time between two yields of Dial.render_steps, best of five
+    longest = None
+    for _ in range(5):
+        dial = Dial(width=240, height=240, padding=12, lazy=True)
+        worst = 0
+        start = time.perf_counter()
+        for _ in dial.render_steps():
+            now = time.perf_counter()
+            worst = max(worst, now - start)
+            start = now
+        worst = max(worst, time.perf_counter() - start)
+        if longest is None or worst < longest:
+            longest = worst
+    return longest
+
+
+def bench_needle_updates():
+    """Needle ``value`` updates per second for one to ``MAX_NEEDLES`` needles"""
+    results = {}
+    for count in range(1, MAX_NEEDLES + 1):
+        dial = Dial(width=240, height=240, padding=12)
+        needles = [needle(dial) for _ in range(count)]
+
+        def run(needles=needles):
+            for i in range(UPDATES):
+                for this_needle in needles:
+                    this_needle.value = (i % 100) + 0.5
+
+        results["needles_%d_updates_per_s" % count] = (UPDATES * count) / _best_of(
+            run, repeat=7
+        )
+
+    dial = Dial(width=240, height=240, padding=12)
+    table_needle = needle(dial, trig_table=True)
+
+    def run_table():
+        for i in range(UPDATES):
+            table_needle.value = (i % 100) + 0.5
+
+    results["needle_table_updates_per_s"] = UPDATES / _best_of(run_table, repeat=7)
+
+    fixed_needle = needle(dial, fixed_point=True)
+
+    def run_fixed():
+        for i in range(UPDATES):
+            fixed_needle.value = (i % 100) + 0.5
+
+    results["needle_fixed_updates_per_s"] = UPDATES / _best_of(run_fixed, repeat=7)
+
+    step_needle = needle(dial, max_value=60, value_step=1)
+
+    def run_steps():
+        for i in range(UPDATES):
+            step_needle.value = i % 60
+
+    results["needle_steps_updates_per_s"] = UPDATES / _best_of(run_steps, repeat=7)
+    return results
+
+
+CIRCLE_RADII = (50, 100, 200, 400)
+
+
+def _draw_circle_pixels(bitmap, center_x, center_y, radius, value):
+    # the per-pixel midpoint loop Dial used before the span version
+    x = 0
+    y = radius
+    decision = 3 - 2 * radius
+    while x <= y:
+        bitmap[x + center_x, y + center_y] = value
+        bitmap[-x + center_x, -y + center_y] = value
+        bitmap[x + center_x, -y + center_y] = value
+        bitmap[-x + center_x, y + center_y] = value
+        bitmap[y + center_x, x + center_y] = value
+        bitmap[-y + center_x, x + center_y] = value
+        bitmap[-y + center_x, -x + center_y] = value
+        bitmap[y + center_x, -x + center_y] = value
+        if decision <= 0:
+            decision = decision + (4 * x) + 6
+        else:
+            decision = decision + 4 * (x - y) + 10
+            y = y - 1
+        x = x + 1
+
+
+class _CountingBitmap(headless.Bitmap):
+    calls = 0
+
+    def __setitem__(self, index, value):
+        _CountingBitmap.calls += 1
+        super().__setitem__(index, value)
+
+
+def _count_calls(function, radius):
+    # bitmap writes plus fill_region calls: on a board both are native calls
+    # of similar cost, unlike in the headless backend
+    bitmaptools = sys.modules["bitmaptools"]
+    fill_region = bitmaptools.fill_region
+
+    def counting_fill_region(*args):
+        _CountingBitmap.calls += 1
+        fill_region(*args)
+
+    size = 2 * radius + 1
+    _CountingBitmap.calls = 0
+    bitmaptools.fill_region = counting_fill_region
+    try:
+        function(_CountingBitmap(size, size, 3), radius, radius, radius, 1)
+    finally:
+        bitmaptools.fill_region = fill_region
+    return _CountingBitmap.calls
+
+
+def bench_circle():
+    """Time and native calls to draw the dial circle per pixel and with spans,
+    the fallback when the firmware has no bitmaptools.draw_circle. Headless
+    fill_region is Python, on a board the calls are what counts."""
+    results = {}
+    for radius in CIRCLE_RADII:
+        size = 2 * radius + 1
+        bitmap = headless.Bitmap(size, size, 3)
+        for name, function in (
+            ("pixels", _draw_circle_pixels),
+            ("spans", _draw_circle_spans),
+        ):
+            results["circle_%d_%s_s" % (radius, name)] = _best_of(
+                lambda function=function, bitmap=bitmap, radius=radius: function(
+                    bitmap, radius, radius, radius, 1
+                )
+            )
+            results["circle_%d_%s_calls" % (radius, name)] = _count_calls(
+                function, radius
+            )
+    return results
+
+
+TICK_COUNTS = (40, 100, 200)
+
+
+def bench_ticks():
+    """Seconds to draw 40 to 200 ticks with rotozoom and as filled polygons"""
+    results = {}
+    for style in ("rotozoom", "polygon"):
+        dial = Dial(width=240, height=240, padding=12, tick_style=style)
+        for count in TICK_COUNTS:
+            results["ticks_%d_%s_s" % (count, style)] = _best_of(
+                lambda dial=dial, count=count: dial.draw_ticks(
+                    tick_count=count, tick_stroke=3, tick_length=10
+                )
+            )
+    return results
+
+
+def bench_sprite_needle():
+    """Needle updates per second with a vectorio polygon and with a sprite sheet,
+    and the sprite sheet cost"""
+    results = {}
+    for kind, needle_class in (("polygon", needle), ("sprite", sprite_needle)):
+        dial = Dial(width=240, height=240, padding=12)
+        this_needle = needle_class(dial)
+
+        def run(this_needle=this_needle):
+            for i in range(UPDATES):
+                this_needle.value = (i % 100) + 0.5
+
+        results["needle_%s_updates_per_s" % kind] = UPDATES / _best_of(run, repeat=7)
+    dial = Dial(width=240, height=240, padding=12)
+    results["sprite_needle_construction_s"] = _best_of(
+        lambda: sprite_needle(dial), repeat=3
+    )
+    results["sprite_needle_sheet_bytes"] = sprite_needle(dial).sheet_bytes
+    return results
+
+
+def _allocated():
+    # allocation counter of the platform: CPython block count or MicroPython heap
+    if hasattr(sys, "getallocatedblocks"):
+        return sys.getallocatedblocks()
+    return gc.mem_alloc()  # pylint: disable=no-member
+
+
+def bench_steady_state():
+    """Allocation growth over thousands of needle updates, which must be zero"""
+    dial = Dial(width=240, height=240, padding=12)
+    needles = (
+        needle(dial),
+        needle(dial, trig_table=True),
+        needle(dial, fixed_point=True),
+    )
+    results = {}
+    for this_needle, name in zip(needles, ("math", "table", "fixed")):
+        gc.collect()
+        gc.disable()
+        try:
+            # the first pass warms up interpreter caches, only the second counts
+            for _ in range(2):
+                before = _allocated()
+                for i in range(UPDATES * 2):
+                    this_needle.value = (i % 100) + 0.5
+                growth = _allocated() - before
+        finally:
+            gc.enable()
+        results["needle_%s_steady_alloc_growth" % name] = max(0, growth)
+    return results
+
+
+def bench_memory():
+    """Bytes allocated per needle update and retained per dial"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        dial = Dial(width=240, height=240, padding=12)
+        dial_bytes = tracemalloc.get_traced_memory()[0] - before
+
+        first = Dial(width=240, height=240, padding=12, share_face=True)
+        before = tracemalloc.get_traced_memory()[0]
+        second = Dial(width=240, height=240, padding=12, share_face=True)
+        shared_dial_bytes = tracemalloc.get_traced_memory()[0] - before
+        second.deinit()
+        first.deinit()
+
+        dial.major_tick_labels = ("0", "50", "100", "150")
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        dial.major_tick_labels = ("0", "25", "50", "75")
+        relabel_peak_bytes = tracemalloc.get_traced_memory()[1] - before
+
+        this_needle = needle(dial)
+        this_needle.value = 1
+        transient = 0
+        before = tracemalloc.get_traced_memory()[0]
+        for i in range(UPDATES):
+            tracemalloc.reset_peak()
+            start = tracemalloc.get_traced_memory()[0]
+            this_needle.value = (i % 100) + 0.5
+            transient += tracemalloc.get_traced_memory()[1] - start
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    results = {
+        "dial_240_bytes": dial_bytes,
+        "dial_240_shared_face_bytes": shared_dial_bytes,
+        "dial_240_relabel_peak_bytes": relabel_peak_bytes,
+        "needle_update_bytes": transient / UPDATES,
+        "needle_retained_bytes_per_update": max(0, retained) / UPDATES,
+    }
+    # the needle object and its attribute storage, without the polygon
+    results["needle_instance_bytes"] = sys.getsizeof(this_needle) + (
+        sys.getsizeof(this_needle.__dict__) if hasattr(this_needle, "__dict__") else 0
+    )
+    for size in DIAL_SIZES:
+        # face pixel data with the ticks on an index of their own, and shared
+        # with the labels in monochrome mode
+        results["dial_%d_face_bytes" % size] = Dial(
+            width=size, height=size, padding=12, tick_color=0xFF0000, lazy=True
+        ).face_bytes
+        results["dial_%d_monochrome_face_bytes" % size] = Dial(
+            width=size, height=size, padding=12, monochrome=True, lazy=True
+        ).face_bytes
+    return results
+
+
+BENCHMARKS = (
+    bench_calibration,
+    bench_construction,
+    bench_needle_updates,
+    bench_memory,
+    bench_steady_state,
+    bench_circle,
+    bench_ticks,
+    bench_sprite_needle,
+)
+
+# metrics that fail whenever they are not zero, whatever the baseline says
+MUST_BE_ZERO = ("_steady_alloc_growth",)
+
+
+def run_benchmarks():
+    """Run every benchmark and return the merged metrics"""
+    results = {}
+    for benchmark in BENCHMARKS:
+        results.update(benchmark())
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Return the metrics that regressed more than ``threshold`` (a fraction)
+    against ``baseline``, as ``(name, baseline value, new value)``. Timings
+    are scaled by the ratio of the ``calibration_s`` reference loops first."""
+    regressions = []
+    speed = 1.0
+    if results.get("calibration_s") and baseline.get("calibration_s"):
+        speed = results["calibration_s"] / baseline["calibration_s"]
+    for name, value in results.items():
+        if name.endswith(MUST_BE_ZERO):
+            if value:
+                regressions.append((name, 0, value))
+            continue
+        reference = baseline.get(name)
+        if reference is None or name == "calibration_s":
+            continue
+        if name.endswith(HIGHER_IS_BETTER):
+            regressed = value < reference / speed * (1 - threshold)
+        elif name.endswith(TIMINGS):
+            regressed = value > reference * speed * (1 + threshold)
+        else:
+            # allow a byte of slack on byte and count metrics that are ideally zero
+            regressed = value > reference * (1 + threshold) + 1
+        if regressed:
+            regressions.append((name, reference, value))
+    return regressions
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 2)[1])
+    parser.add_argument("--save", action="store_true", help="store a new baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.3,
+        help="allowed regression as a fraction of the baseline (default 0.3)",
+    )
+    parser.add_argument("--baseline", default=BASELINE, help="baseline JSON file")
+    parser.add_argument(
+        "--strict-timings",
+        action="store_true",
+        help="fail on slower timings too, instead of only warning",
+    )
+    args = parser.parse_args()
+
+    results = run_benchmarks()
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+
+    for name, value in results.items():
+        reference = baseline.get(name)
+        line = "%-40s %14.6g" % (name, value)
+        if reference:
+            line += "  (baseline %.6g, %+.1f%%)" % (
+                reference,
+                100 * (value - reference) / reference,
+            )
+        print(line)
+
+    if args.save:
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+            file.write("\n")
+        print("Baseline saved to %s" % args.baseline)
+        return 0
+
+    failed = False
+    for name, reference, value in compare(results, baseline, args.threshold):
+        if name.endswith(TIMINGS) and not args.strict_timings:
+            print("SLOWER %s: %.6g -> %.6g" % (name, reference, value))
+        else:
+            print("REGRESSION %s: %.6g -> %.6g" % (name, reference, value))
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+# SPDX-FileCopyrightText: 2023 Jose David Montoya
+#
+# SPDX-License-Identifier: MIT
+"""
+
+`dial_asyncio`
+================================================================================
+asyncio task moving the needles of one or more dials to the latest values
+published by other coroutines, and refreshing the display at a fixed rate.
+
+* Author(s): Jose David Montoya
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+* asyncio, in the CircuitPython bundle or the CPython standard library
+
+"""
+
+import asyncio
+from circuitpython_simple_dial.needle_animation import (
+    TICKS_PER_SECOND,
+    NeedleAnimator,
+    ease_out_quad,
+    ticks,
+)
+
+# pylint: disable=too-many-arguments, protected-access
+
+
+class DialCoordinator:
+    """Owns the dials, animates their needles and refreshes the display
+
+    Producers call :meth:`set_value` whenever they have a new reading, it never
+    blocks. The :meth:`run` task animates every needle towards its latest value
+    and refreshes the display at most ``frame_rate`` times per second, only when
+    a needle moved.
+
+    :param dials: the `Dial` objects to own, their needles are animated
+    :param display: display to refresh, or `None` when it refreshes on its own
+    :param float frame_rate: frames per second. Defaults to :const:`20`
+    :param float duration: time for a needle to reach a new value, in seconds.
+     Defaults to :const:`0.25`
+    :param easing: easing function for the needle movement. Defaults to
+     :func:`~circuitpython_simple_dial.needle_animation.ease_out_quad`
+
+    .. code-block:: python
+
+        coordinator = DialCoordinator([my_dial], display, frame_rate=20)
+
+        async def read_sensor():
+            while True:
+                coordinator.set_value(my_needle, sensor.temperature)
+                await asyncio.sleep(0.1)
+
+        async def main():
+            await asyncio.gather(coordinator.run(), read_sensor())
+
+        asyncio.run(main())
+
+    """
+
+    def __init__(
+        self, dials, display=None, frame_rate=20, duration=0.25, easing=ease_out_quad
+    ):
+        self._dials = list(dials)
+        self._display = display
+        self._frame_interval = 1 / frame_rate
+        self._duration = duration
+        self._animators = {}
+        for dial in self._dials:
+            for this_needle in dial._needles:
+                self._animators[this_needle] = NeedleAnimator(
+                    this_needle, frame_rate=frame_rate, easing=easing
+                )
+        self._targets = {}
+        self._running = False
+
+    def set_value(self, needle_object, value):
+        """Publish a new value for ``needle_object``. Only the latest value
+        published before the next frame is used.
+
+        :param needle_object: a needle of one of the owned dials
+        :param float value: the new needle value
+        """
+        if needle_object not in self._animators:
+            raise ValueError("needle does not belong to a coordinated dial")
+        self._targets[needle_object] = value
+
+    def step(self):
+        """Compute one frame: start the animations for the published values,
+        move the needles and refresh the display. Returns `True` when a needle
+        moved. :meth:`run` calls it once per frame."""
+        if self._targets:
+            targets = self._targets
+            self._targets = {}
+            for this_needle, value in targets.items():
+                animator = self._animators[this_needle]
+                if value != animator.target:
+                    animator.animate_to(value, self._duration)
+
+        moved = False
+        for dial in self._dials:
+            with dial:  # apply all the needles of the dial together
+                for this_needle in dial._needles:
+                    animator = self._animators.get(this_needle)
+                    if animator is not None and animator.update():
+                        moved = True
+        if moved and self._display is not None:
+            self._display.refresh()
+        return moved
+
+    async def run(self):
+        """Animate and refresh until :meth:`stop` is called"""
+        self._running = True
+        while self._running:
+            start = ticks()
+            self.step()
+            # sleep for the rest of the frame, always yielding to the producers
+            await asyncio.sleep(
+                max(0, self._frame_interval - (ticks() - start) / TICKS_PER_SECOND)
+            )
+
+    def stop(self):
+        """Make :meth:`run` return after the current frame"""
+        self._running = False
@@ -23,13 +23,127 @@ Implementation Notes
 import math
 import displayio
 import vectorio
+from circuitpython_simple_dial.trig_table import FIXED_BITS, get_table
 
 # pylint: disable=too-many-lines, too-many-instance-attributes, too-many-arguments
 # pylint: disable=too-many-locals, too-many-statements, attribute-defined-outside-init
 # pylint: disable=unused-argument, unsubscriptable-object, undefined-variable, invalid-name
+# pylint: disable=too-many-boolean-expressions, protected-access
 
+_TWO_PI = 2 * math.pi
+# a list of four items (16 + 16 bytes), four 2-tuples (16 bytes each) and
+# the bounding box 4-tuple (32 bytes)
+_STEP_BYTES = 128
 
-class needle:
+# smallest float step above 1.0: 2 ** -52 on CPython, about 2 ** -22 with the
+# 30 bit floats of CircuitPython
+_EPSILON = 1.0
+while 1.0 + _EPSILON / 2 != 1.0:
+    _EPSILON /= 2
+
+_FIXED_ONE = 1 << FIXED_BITS
+_FIXED_HALF = 1 << (FIXED_BITS - 1)
+_FIXED_MASK = (1 << FIXED_BITS) - 1
+# smallest dial radius whose table the fixed-point needles use: its steps keep
+# the angle correction products below 2 ** 30, the small int limit of
+# CircuitPython, so an update allocates no long integers
+_FIXED_MIN_RADIUS = 40
+
+
+def _points_bounds(points, bounds):
+    # bounding box of four points as [x1, y1, x2, y2], x2 and y2 exclusive
+    bounds[0] = min(points[0][0], points[1][0], points[2][0], points[3][0])
+    bounds[1] = min(points[0][1], points[1][1], points[2][1], points[3][1])
+    bounds[2] = max(points[0][0], points[1][0], points[2][0], points[3][0]) + 1
+    bounds[3] = max(points[0][1], points[1][1], points[2][1], points[3][1]) + 1
+
+
+class NeedleBase:
+    """
+    The value, batching, dirty area and update counters shared by :class:`needle`
+    and :class:`~circuitpython_simple_dial.sprite_needle.sprite_needle`.
+
+    A subclass calls ``__init__`` first, sets ``_dirty``, the area
+    :attr:`dirty_area` returns, and implements ``_prepare_update`` and
+    ``_apply_points``.
+
+    :param dial_object: dial object for the needle to be drawn on
+    :param float value: the value to display
+    """
+
+    # the state this class reads, the subclass slots hold the rest
+    __slots__ = (
+        "_dial",
+        "_value",
+        "_pending",
+        "_dirty",
+        "_is_dirty",
+        "_applied_updates",
+        "_skipped_updates",
+    )
+
+    def __init__(self, dial_object, value):
+        self._dial = dial_object
+        self._value = value
+        self._pending = False
+        self._dirty = None
+        self._is_dirty = False
+        self._applied_updates = 0
+        self._skipped_updates = 0
+
+    def _prepare_update(self, value):
+        # Get the drawing for ``value`` ready; returns False, and counts a
+        # skipped update, when the needle would not change.
+        raise NotImplementedError
+
+    def _apply_points(self):
+        # Show the drawing _prepare_update got ready and dirty its area.
+        raise NotImplementedError
+
+    def _update_needle(self, value):
+        if self._prepare_update(value):
+            self._apply_points()
+
+    @property
+    def value(self):
+        """The dial's value."""
+        return self._value
+
+    @value.setter
+    def value(self, new_value):
+        if new_value != self._value:
+            self._value = new_value
+            if self._dial._defer_needles:
+                # the dial computes and applies it when the batch ends
+                self._pending = True
+            else:
+                self._update_needle(self._value)
+
+    @property
+    def dirty_area(self):
+        """The area changed by the needle since the last :meth:`clear_dirty_area`,
+        as ``(x1, y1, x2, y2)`` in dial coordinates with ``x2`` and ``y2``
+        exclusive, or `None` when the needle did not move."""
+        if not self._is_dirty:
+            return None
+        return tuple(self._dirty)
+
+    def clear_dirty_area(self):
+        """Forget the changed area, usually once the display was refreshed."""
+        self._is_dirty = False
+
+    @property
+    def applied_updates(self):
+        """Number of value changes that changed the needle on screen"""
+        return self._applied_updates
+
+    @property
+    def skipped_updates(self):
+        """Number of value changes skipped because the needle would not change"""
+        return self._skipped_updates
+
+
+class needle(NeedleBase):
     """
     Class needle
 
@@ -44,10 +158,64 @@ class needle:
     :param float min_value: the minimum value displayed on the dial. Defaults to :const:`0.0`
     :param float max_value: the maximum value displayed the dial. Defaults to :const:`100.0`
     :param float value: the value to display (if None, defaults to ``min_value``)
+    :param bool trig_table: Set to True to read the needle angle sine and cosine from
+     a lookup table shared by all the needles, instead of computing them on every
+     update. The pixels are the same as without the table. It is slower than
+     ``math`` on CPython, so measure it on the board before turning it on, see
+     :mod:`circuitpython_simple_dial.trig_table`. Defaults to `False`
+    :param float value_step: Set to declare that the needle only shows ``min_value``
+     plus multiples of ``value_step``, e.g. :const:`1` for the hours of a clock. It
+     must divide the value range. The points for every step are computed once, and
+     updates become a table lookup. Other values are rounded to the nearest step.
+     Defaults to `None`
+    :param bool fixed_point: Set to True to compute the needle corners with integers
+     from the sine table, for boards without a floating point unit. The pixels are
+     the same as without it, like with ``trig_table``: corners too close to a half
+     pixel for the integer error are computed with ``math.sin`` and ``math.cos``.
+     The integer table takes about 1.5 KB for a 120 pixel radius dial, shared by
+     the needles of the dials of that size. It is slower than ``math`` on CPython
+     and not measured on a board yet, see
+     :data:`~circuitpython_simple_dial.trig_table.SOFT_FLOAT`. Defaults to `False`
 
 
     """
 
+    # fixed attribute storage instead of an instance dict, and each setting kept
+    # once: on CPython an instance takes 320 bytes, less than a fifth of the
+    # object and its dict. CircuitPython ignores __slots__, there the saving is
+    # the three attributes that were dropped. NeedleBase holds the shared ones.
+    __slots__ = (
+        "_dial_center",
+        "_dial_radius",
+        "_dial_half",
+        "_needle_width",
+        "_needle_pad",
+        "_min_value",
+        "_max_value",
+        "_limit_rotation",
+        "_value_step",
+        "_trig_table",
+        "_table_limit",
+        "_sin_cos",
+        "_fixed_point",
+        "_fixed_center",
+        "_fixed_margin",
+        "_needle_length",
+        "_half_width",
+        "_value_scale",
+        "_value_offset",
+        "_step_points",
+        "_step_bounds",
+        "_step_scale",
+        "_step_offset",
+        "_step_count",
+        "_step_index",
+        "_needle_palette",
+        "_needle",
+        "_points",
+        "_bounds",
+    )
+
     def __init__(
         self,
         dial_object,
@@ -59,33 +227,53 @@ class needle:
         value=None,
         min_value=0.0,
         max_value=100.0,
+        trig_table=False,
+        value_step=None,
+        fixed_point=False,
     ):
         if needle_full:
             self._dial_half = 1
         else:
             self._dial_half = 0
 
-        self._needle_width_requested = needle_width
-        self._needle_color = needle_color
-        self._needle_pad = needle_pad
-
+        if value is None:
+            value = min_value
+        super().__init__(dial_object, value)
         self._min_value = min_value
         self._max_value = max_value
-        if value is None:
-            self._value = self._min_value
-        else:
-            self._value = value
-
-        self._dial_half = needle_full
         self._dial_center = dial_object._dial_center
         self._dial_radius = dial_object._dial_radius
         self._needle_width = needle_width
-
         self._needle_pad = needle_pad
         self._limit_rotation = limit_rotation
+        self._value_step = value_step
+
+        self._fixed_point = fixed_point
+        self._fixed_center = (
+            dial_object._dial_center[0] << FIXED_BITS,
+            dial_object._dial_center[1] << FIXED_BITS,
+        )
+        if fixed_point:
+            self._trig_table = get_table(max(self._dial_radius, _FIXED_MIN_RADIUS))
+            self._trig_table.add_fixed()
+        elif trig_table:
+            self._trig_table = get_table(self._dial_radius)
+        else:
+            self._trig_table = None
+
+        self._update_geometry()
 
         self._needle_palette = displayio.Palette(1)
-        self._needle_palette[0] = self._needle_color
+        self._needle_palette[0] = needle_color
+
+        # point buffer reused by every update, see _draw_position
+        self._points = [(0, 0), (0, 0), (0, 0), (0, 0)]
+        # sine and cosine written by the trig table on every update
+        self._sin_cos = [0.0, 0.0]
+        # bounding box of the polygon on screen and area changed since the
+        # last clear_dirty_area(), both as [x1, y1, x2, y2] with x2, y2 exclusive
+        self._bounds = [0, 0, 0, 0]
+        self._dirty = [0, 0, 0, 0]
 
         self._needle = vectorio.Polygon(
             points=[(100, 100), (100, 50), (50, 50), (50, 100)],
@@ -95,91 +283,384 @@ class needle:
         )
         self._update_needle(self._value)
         dial_object.append(self._needle)
-
-    def _update_needle(self, value):
-        if self._limit_rotation:  # constrain between min_value and max_value
-            value = max(min(self._value, self._max_value), self._min_value)
-
-        self._draw_position(
-            value / (self._max_value - self._min_value)
-        )  # convert to position (0.0 to 1.0)
-
-    def _draw_position(self, position):
-        # Get the position offset from the motion function
-        angle_offset = (2 * math.pi / 360) * (-180 + 360 * position)
-
-        d_x = (self._needle_width / 2) * math.cos(angle_offset)
-        d_y = (self._needle_width / 2) * math.sin(angle_offset)
-
-        x_0 = round(
-            self._dial_center[0]
-            - (
-                (self._dial_radius - self._needle_pad)
-                * math.sin(angle_offset)
-                * self._dial_half
+        dial_object._needles.append(self)
+
+    def _update_geometry(self):
+        # constants of the needle drawing, refreshed only when the
+        # configuration changes so _draw_position does not recompute them
+        self._needle_length = self._dial_radius - self._needle_pad
+        self._half_width = self._needle_width / 2
+        if self._max_value == self._min_value:
+            raise ValueError("min_value and max_value must be different")
+        self._value_scale = 1 / (self._max_value - self._min_value)
+        self._value_offset = -self._min_value * self._value_scale
+        # largest error of the table corners, in pixels, plus the float
+        # rounding of both paths on coordinates up to the dial size; a corner
+        # further than the limit from its nearest integer is too close to a half
+        if self._trig_table is not None:
+            reach = abs(self._needle_length) + self._needle_width
+            self._table_limit = 0.5 - (
+                self._trig_table.max_error(reach)
+                + 16 * _EPSILON * (max(self._dial_center) + reach)
             )
-            - d_x
-        )
-        y_0 = round(
-            self._dial_center[1]
-            + (
-                (self._dial_radius - self._needle_pad)
-                * math.cos(angle_offset)
-                * self._dial_half
+        # the same for the fixed-point corners, in 2 ** -FIXED_BITS pixels, plus
+        # the truncated half width; integer sizes only
+        if (
+            self._fixed_point
+            and isinstance(self._needle_length, int)
+            and isinstance(self._needle_width, int)
+        ):
+            reach = abs(self._needle_length) + self._needle_width
+            margin = self._trig_table.max_fixed_error(reach) + 16 * _EPSILON * (
+                max(self._dial_center) + reach
             )
-            - d_y
-        )
+            self._fixed_margin = math.ceil(margin * _FIXED_ONE) + 1
+        else:
+            self._fixed_margin = None
+        self._update_step_table()
+
+    def _update_step_table(self):
+        # for discrete needles, the points of every step, already as the
+        # tuples vectorio takes, so an update only copies four references
+        self._step_index = None
+        if self._value_step is None:
+            self._step_points = None
+            return
+        steps = abs(self._max_value - self._min_value) / self._value_step
+        step_count = round(steps)
+        if step_count < 1:
+            raise ValueError("value_step must be smaller than the value range")
+        if abs(steps - step_count) > 0.001:
+            raise ValueError("value_step must divide the value range")
+        if self._max_value < self._min_value:
+            step_scale = -1 / self._value_step
+        else:
+            step_scale = 1 / self._value_step
+        self._step_scale = step_scale
+        self._step_offset = -self._min_value * step_scale
+        self._step_count = step_count
+        self._step_points = []
+        self._step_bounds = []
+        # one entry past the last step: max_value is drawn on its own, as its
+        # corners may round differently from the min_value ones
+        for index in range(step_count + 1):
+            if index == step_count:
+                step_value = self._max_value
+            elif step_scale < 0:
+                step_value = self._min_value - index * self._value_step
+            else:
+                step_value = self._min_value + index * self._value_step
+            # the position the continuous needle gives the same value
+            position = step_value * self._value_scale + self._value_offset
+            position = min(max(position, 0.0), 1.0)
+            points = [(0, 0), (0, 0), (0, 0), (0, 0)]
+            self._compute_points(position, points)
+            self._step_points.append(points)
+            bounds = [0, 0, 0, 0]
+            _points_bounds(points, bounds)
+            self._step_bounds.append(tuple(bounds))
+
+    def _prepare_update(self, value):
+        # Update the point buffer for ``value``; returns False, and counts a
+        # skipped update, when the needle would not move.
+        if self._step_points is not None:
+            return self._prepare_step(value)
+        # affine map from value to position (0.0 to 1.0 between min_value
+        # and max_value), clamped when the rotation is limited
+        position = value * self._value_scale + self._value_offset
+        if self._limit_rotation:
+            if position < 0.0:
+                position = 0.0
+            elif position > 1.0:
+                position = 1.0
+        return self._prepare_position(position)
+
+    def _prepare_step(self, value):
+        index = round(value * self._step_scale + self._step_offset)
+        if self._limit_rotation:
+            if index < 0:
+                index = 0
+            elif index > self._step_count:
+                index = self._step_count
+        else:
+            index %= self._step_count
+        if index == self._step_index:
+            self._skipped_updates += 1
+            return False
+        step_points = self._step_points[index]
+        points = self._points
+        points[0] = step_points[0]
+        points[1] = step_points[1]
+        points[2] = step_points[2]
+        points[3] = step_points[3]
+        self._step_index = index
+        return True
+
+    def _prepare_position(self, position):
+        if self._compute_points(position, self._points):
+            self._step_index = None
+            return True
+        # same pixels as on screen, do not dirty the polygon area
+        self._skipped_updates += 1
+        return False
+
+    def _apply_points(self):
+        # vectorio copies the points, so the same list is handed over every time
+        self._needle.points = self._points
+        self._applied_updates += 1
+
+        # the screen area that changes is the union of the old and the new
+        # polygon bounding boxes, accumulated until the dirty area is cleared
+        points = self._points
+        bounds = self._bounds
+        dirty = self._dirty
+        if not self._is_dirty:
+            dirty[0] = bounds[0]
+            dirty[1] = bounds[1]
+            dirty[2] = bounds[2]
+            dirty[3] = bounds[3]
+            self._is_dirty = True
+        if self._step_index is None:
+            _points_bounds(points, bounds)
+        else:
+            step_bounds = self._step_bounds[self._step_index]
+            bounds[0] = step_bounds[0]
+            bounds[1] = step_bounds[1]
+            bounds[2] = step_bounds[2]
+            bounds[3] = step_bounds[3]
+        if dirty[2] <= dirty[0]:  # nothing drawn before
+            dirty[0] = bounds[0]
+            dirty[1] = bounds[1]
+            dirty[2] = bounds[2]
+            dirty[3] = bounds[3]
+            return
+        if bounds[0] < dirty[0]:
+            dirty[0] = bounds[0]
+        if bounds[1] < dirty[1]:
+            dirty[1] = bounds[1]
+        if bounds[2] > dirty[2]:
+            dirty[2] = bounds[2]
+        if bounds[3] > dirty[3]:
+            dirty[3] = bounds[3]
 
-        x_1 = round(
-            self._dial_center[0]
-            - (
-                (self._dial_radius - self._needle_pad)
-                * math.sin(angle_offset)
-                * self._dial_half
-            )
-            + d_x
-        )
-        y_1 = round(
-            self._dial_center[1]
-            + (
-                (self._dial_radius - self._needle_pad)
-                * math.cos(angle_offset)
-                * self._dial_half
+    def _draw_position(self, position):
+        if self._prepare_position(position):
+            self._apply_points()
+
+    def _compute_points(self, position, points):
+        # Write the needle corners for ``position`` in ``points``, a list of
+        # four (x, y) tuples; returns False when they already hold them.
+        x_0 = None
+        if self._fixed_margin is not None:
+            # the same corners in 2 ** -FIXED_BITS pixels, with integers from
+            # the angle on; the needle width is halved by the final shift
+            table = self._trig_table
+            if position < 0.0 or position > 1.0:
+                # keep the angle below 2 ** 30, the small int limit
+                position %= 1.0
+            sin_cos = self._sin_cos
+            table.corrected_fixed_sin_cos(
+                round(position * table.fixed_turn) - (table.fixed_turn >> 1), sin_cos
             )
-            + d_y
-        )
+            sin_fixed = sin_cos[0]
+            cos_fixed = sin_cos[1]
+
+            d_x = (self._needle_width * cos_fixed) >> 1
+            d_y = (self._needle_width * sin_fixed) >> 1
+
+            length_sin = self._needle_length * sin_fixed
+            length_cos = self._needle_length * cos_fixed
+
+            tail_x = self._fixed_center[0] - length_sin * self._dial_half
+            tail_y = self._fixed_center[1] + length_cos * self._dial_half
+            tip_x = self._fixed_center[0] + length_sin
+            tip_y = self._fixed_center[1] - length_cos
+
+            corner_x_0 = tail_x - d_x
+            corner_y_0 = tail_y - d_y
+            corner_x_1 = tail_x + d_x
+            corner_y_1 = tail_y + d_y
+            corner_x_2 = tip_x + d_x
+            corner_y_2 = tip_y + d_y
+            corner_x_3 = tip_x - d_x
+            corner_y_3 = tip_y - d_y
+            margin = self._fixed_margin
+            if (
+                abs((corner_x_0 & _FIXED_MASK) - _FIXED_HALF) > margin
+                and abs((corner_y_0 & _FIXED_MASK) - _FIXED_HALF) > margin
+                and abs((corner_x_1 & _FIXED_MASK) - _FIXED_HALF) > margin
+                and abs((corner_y_1 & _FIXED_MASK) - _FIXED_HALF) > margin
+                and abs((corner_x_2 & _FIXED_MASK) - _FIXED_HALF) > margin
+                and abs((corner_y_2 & _FIXED_MASK) - _FIXED_HALF) > margin
+                and abs((corner_x_3 & _FIXED_MASK) - _FIXED_HALF) > margin
+                and abs((corner_y_3 & _FIXED_MASK) - _FIXED_HALF) > margin
+            ):
+                x_0 = (corner_x_0 + _FIXED_HALF) >> FIXED_BITS
+                y_0 = (corner_y_0 + _FIXED_HALF) >> FIXED_BITS
+                x_1 = (corner_x_1 + _FIXED_HALF) >> FIXED_BITS
+                y_1 = (corner_y_1 + _FIXED_HALF) >> FIXED_BITS
+                x_2 = (corner_x_2 + _FIXED_HALF) >> FIXED_BITS
+                y_2 = (corner_y_2 + _FIXED_HALF) >> FIXED_BITS
+                x_3 = (corner_x_3 + _FIXED_HALF) >> FIXED_BITS
+                y_3 = (corner_y_3 + _FIXED_HALF) >> FIXED_BITS
+            # otherwise too close to a half pixel, use math.sin and math.cos
+        elif self._trig_table is not None:
+            # the table step moved to the exact angle, see trig_table
+            sin_cos = self._sin_cos
+            self._trig_table.corrected_sin_cos(position - 0.5, sin_cos)
+            sin_angle = sin_cos[0]
+            cos_angle = sin_cos[1]
+
+            d_x = self._half_width * cos_angle
+            d_y = self._half_width * sin_angle
+
+            length_sin = self._needle_length * sin_angle
+            length_cos = self._needle_length * cos_angle
+
+            tail_x = self._dial_center[0] - (length_sin * self._dial_half)
+            tail_y = self._dial_center[1] + (length_cos * self._dial_half)
+            tip_x = self._dial_center[0] + length_sin
+            tip_y = self._dial_center[1] - length_cos
+
+            corner_x_0 = tail_x - d_x
+            corner_y_0 = tail_y - d_y
+            corner_x_1 = tail_x + d_x
+            corner_y_1 = tail_y + d_y
+            corner_x_2 = tip_x + d_x
+            corner_y_2 = tip_y + d_y
+            corner_x_3 = tip_x - d_x
+            corner_y_3 = tip_y - d_y
+            x_0 = round(corner_x_0)
+            y_0 = round(corner_y_0)
+            x_1 = round(corner_x_1)
+            y_1 = round(corner_y_1)
+            x_2 = round(corner_x_2)
+            y_2 = round(corner_y_2)
+            x_3 = round(corner_x_3)
+            y_3 = round(corner_y_3)
+            limit = self._table_limit
+            if (
+                abs(corner_x_0 - x_0) > limit
+                or abs(corner_y_0 - y_0) > limit
+                or abs(corner_x_1 - x_1) > limit
+                or abs(corner_y_1 - y_1) > limit
+                or abs(corner_x_2 - x_2) > limit
+                or abs(corner_y_2 - y_2) > limit
+                or abs(corner_x_3 - x_3) > limit
+                or abs(corner_y_3 - y_3) > limit
+            ):
+                x_0 = None  # too close to a half pixel, use math.sin and math.cos
+
+        if x_0 is None:
+            # Get the position offset from the motion function
+            angle_offset = _TWO_PI * position - math.pi
+            sin_angle = math.sin(angle_offset)
+            cos_angle = math.cos(angle_offset)
+
+            d_x = self._half_width * cos_angle
+            d_y = self._half_width * sin_angle
+
+            length_sin = self._needle_length * sin_angle
+            length_cos = self._needle_length * cos_angle
+
+            tail_x = self._dial_center[0] - (length_sin * self._dial_half)
+            tail_y = self._dial_center[1] + (length_cos * self._dial_half)
+            tip_x = self._dial_center[0] + length_sin
+            tip_y = self._dial_center[1] - length_cos
+
+            x_0 = round(tail_x - d_x)
+            y_0 = round(tail_y - d_y)
+            x_1 = round(tail_x + d_x)
+            y_1 = round(tail_y + d_y)
+            x_2 = round(tip_x + d_x)
+            y_2 = round(tip_y + d_y)
+            x_3 = round(tip_x - d_x)
+            y_3 = round(tip_y - d_y)
+
+        # compare element by element, so a skipped update creates no
+        # objects at all
+        if (
+            points[0][0] == x_0
+            and points[0][1] == y_0
+            and points[1][0] == x_1
+            and points[1][1] == y_1
+            and points[2][0] == x_2
+            and points[2][1] == y_2
+            and points[3][0] == x_3
+            and points[3][1] == y_3
+        ):
+            return False
+
+        # only the four point tuples vectorio requires are created
+        points[0] = (x_0, y_0)
+        points[1] = (x_1, y_1)
+        points[2] = (x_2, y_2)
+        points[3] = (x_3, y_3)
+        return True
+
+    def _set_config(self, name, new_value):
+        old_value = getattr(self, name)
+        setattr(self, name, new_value)
+        try:
+            self._update_geometry()
+        except ValueError:
+            # the scale, offset and step table may already follow the
+            # rejected value, compute them again from the old one
+            setattr(self, name, old_value)
+            self._update_geometry()
+            raise
+        self._update_needle(self._value)
 
-        x_2 = round(
-            self._dial_center[0]
-            + ((self._dial_radius - self._needle_pad) * math.sin(angle_offset))
-            + d_x
-        )
-        y_2 = round(
-            self._dial_center[1]
-            - ((self._dial_radius - self._needle_pad) * math.cos(angle_offset))
-            + d_y
-        )
+    @property
+    def needle_width(self):
+        """The needle width, in pixels."""
+        return self._needle_width
 
-        x_3 = round(
-            self._dial_center[0]
-            + ((self._dial_radius - self._needle_pad) * math.sin(angle_offset))
-            - d_x
-        )
-        y_3 = round(
-            self._dial_center[1]
-            - ((self._dial_radius - self._needle_pad) * math.cos(angle_offset))
-            - d_y
-        )
+    @needle_width.setter
+    def needle_width(self, new_width):
+        self._set_config("_needle_width", new_width)
+
+    @property
+    def needle_pad(self):
+        """The space between the dial circle and the needle, in pixels."""
+        return self._needle_pad
 
-        self._needle.points = [(x_0, y_0), (x_1, y_1), (x_2, y_2), (x_3, y_3)]
+    @needle_pad.setter
+    def needle_pad(self, new_pad):
+        self._set_config("_needle_pad", new_pad)
 
     @property
-    def value(self):
-        """The dial's value."""
-        return self._value
+    def min_value(self):
+        """The minimum value displayed on the dial."""
+        return self._min_value
 
-    @value.setter
-    def value(self, new_value):
-        if new_value != self._value:
-            self._value = new_value
-            self._update_needle(self._value)
+    @min_value.setter
+    def min_value(self, new_min):
+        self._set_config("_min_value", new_min)
+
+    @property
+    def max_value(self):
+        """The maximum value displayed on the dial."""
+        return self._max_value
+
+    @max_value.setter
+    def max_value(self, new_max):
+        self._set_config("_max_value", new_max)
+
+    @property
+    def value_step(self):
+        """The step between the values a discrete needle shows, `None` for a
+        continuous needle."""
+        return self._value_step
+
+    @value_step.setter
+    def value_step(self, new_step):
+        self._set_config("_value_step", new_step)
+
+    @property
+    def step_table_bytes(self):
+        """Estimated heap used by the step table of a discrete needle on a 32-bit
+        CircuitPython build, :const:`0` for a continuous needle."""
+        if self._step_points is None:
+            return 0
+        return len(self._step_points) * _STEP_BYTES
@@ -0,0 +1,273 @@
+# SPDX-FileCopyrightText: 2023 Jose David Montoya
+#
+# SPDX-License-Identifier: MIT
+"""
+
+`face_cache`
+================================================================================
+Storage of rendered dial faces, so a dial built with the same configuration
+does not render its face again, either from a file or from the faces shared
+in memory by the dials of the running program.
+
+* Author(s): Jose David Montoya
+
+Implementation Notes
+--------------------
+
+A face is keyed by a hash of every setting that changes its pixels: the size,
+padding, ticks, labels, label font and scale, and whether the ticks have a
+palette index of their own. A font loaded from a file is told apart by the
+file size and first bytes. Colors are not part of the key, they live in the
+dial palette. Faces are stored as the bitmap pixel values, packed most
+significant bits first, one file per key, and loaded with
+``bitmaptools.readinto`` when the firmware has it.
+
+Shared faces are reference counted: each dial using one holds a reference
+until its ``deinit``, and the last one releases the bitmap.
+
+On a board the filesystem must be writable from CircuitPython for the faces
+to be saved, see ``storage.remount``. When it is not, the dial renders as
+usual and nothing is stored.
+
+"""
+
+import os
+import bitmaptools
+
+# pylint: disable=protected-access, too-many-boolean-expressions
+
+_MAGIC = b"DIAL"
+_VERSION = 1
+_HEADER_SIZE = 10
+
+
+def _fnv1a(data):
+    # 32-bit FNV-1a, available everywhere unlike hashlib
+    value = 0x811C9DC5
+    for byte in data:
+        value = ((value ^ byte) * 0x01000193) & 0xFFFFFFFF
+    return value
+
+
+def _file_id(file):
+    # size and hash of the first bytes of a font file, where BDF and PCF files
+    # name the font. The fonts seek before each read, moving the file is safe.
+    try:
+        position = file.tell()
+        size = file.seek(0, 2)
+        file.seek(0)
+        header = file.read(256)
+        file.seek(position)
+    except (AttributeError, OSError, ValueError):
+        return None
+    if isinstance(header, str):
+        header = header.encode("utf-8")
+    return (size, _fnv1a(header))
+
+
+def _font_id(font):
+    # fonts have no stable identity across boots, use the file adafruit_bitmap_font
+    # keeps open, so two fonts of the same size differ, and what shapes the glyphs
+    font_id = [type(font).__name__]
+    if hasattr(font, "file"):
+        font_id.append(_file_id(font.file))
+    if hasattr(font, "get_bounding_box"):
+        font_id.append(tuple(font.get_bounding_box()))
+    for name in ("ascent", "descent"):
+        if hasattr(font, name):
+            font_id.append(getattr(font, name))
+    return tuple(font_id)
+
+
+def face_key(dial):
+    """Hash of the settings that define the pixels of the face of ``dial``"""
+    settings = (
+        _VERSION,
+        dial._width,
+        dial._height,
+        dial._padding,
+        dial._major_ticks,
+        dial._major_tick_stroke,
+        dial._major_tick_length,
+        tuple(dial._major_tick_labels),
+        dial._minor_ticks,
+        dial._minor_tick_stroke,
+        dial._minor_tick_length,
+        tuple(dial._minor_ticks_labels or ()),
+        _font_id(dial._tick_label_font),
+        dial._tick_label_scale,
+        dial._rotate_tick_labels,
+        dial._tick_style,
+        dial._tick_index,
+    )
+    return _fnv1a(repr(settings).encode("utf-8"))
+
+
+def face_path(directory, dial):
+    """File name of the face of ``dial`` in ``directory``"""
+    return "%s/%08x.dial" % (directory.rstrip("/"), face_key(dial))
+
+
+def _row_bytes(bitmap):
+    return (bitmap.width * bitmap.bits_per_value + 7) // 8
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def load_face(path, bitmap):
+    """Fill ``bitmap`` with the face stored in ``path``. Returns `False`, leaving
+    the bitmap blank, when there is no matching face. A file whose size does not
+    match its header, e.g. cut short by a reset, is deleted.
+
+    :param str path: face file, as given by :func:`face_path`
+    :param displayio.Bitmap bitmap: the dial bitmap
+    """
+    try:
+        size = os.stat(path)[6]
+    except OSError:
+        return False
+    try:
+        with open(path, "rb") as file:
+            header = file.read(_HEADER_SIZE)
+            if (
+                len(header) != _HEADER_SIZE
+                or header[:4] != _MAGIC
+                or header[4] != _VERSION
+                or header[5] != bitmap.bits_per_value
+                or header[6] | header[7] << 8 != bitmap.width
+                or header[8] | header[9] << 8 != bitmap.height
+            ):
+                return False
+            if size != _HEADER_SIZE + _row_bytes(bitmap) * bitmap.height:
+                raise EOFError("truncated face")
+            if hasattr(bitmaptools, "readinto"):
+                # the core takes the first pixel from the least significant
+                # bits unless told otherwise
+                bitmaptools.readinto(
+                    bitmap,
+                    file,
+                    bitmap.bits_per_value,
+                    reverse_pixels_in_element=True,
+                )
+                return True
+            data = file.read()
+    except (OSError, EOFError, ValueError):
+        bitmap.fill(0)
+        _remove(path)
+        return False
+    _unpack(data, bitmap)
+    return True
+
+
+def _unpack(data, bitmap):
+    bits = bitmap.bits_per_value
+    mask = (1 << bits) - 1
+    per_byte = 8 // bits
+    row_bytes = _row_bytes(bitmap)
+    for y in range(bitmap.height):
+        row = y * row_bytes
+        for x in range(bitmap.width):
+            shift = 8 - bits - (x % per_byte) * bits
+            bitmap[x, y] = (data[row + x // per_byte] >> shift) & mask
+
+
+def save_face(path, bitmap):
+    """Store the pixels of ``bitmap`` in ``path``. Returns `False` when the file
+    cannot be written, e.g. on a read-only filesystem. The face is written under
+    a temporary name and renamed once complete.
+
+    :param str path: face file, as given by :func:`face_path`
+    :param displayio.Bitmap bitmap: the rendered dial bitmap
+    """
+    bits = bitmap.bits_per_value
+    per_byte = 8 // bits
+    row = bytearray(_row_bytes(bitmap))
+    blank = bytes(len(row))
+    temporary = path + ".tmp"
+    try:
+        with open(temporary, "wb") as file:
+            file.write(_MAGIC)
+            file.write(
+                bytes(
+                    (
+                        _VERSION,
+                        bits,
+                        bitmap.width & 0xFF,
+                        bitmap.width >> 8,
+                        bitmap.height & 0xFF,
+                        bitmap.height >> 8,
+                    )
+                )
+            )
+            for y in range(bitmap.height):
+                row[:] = blank
+                for x in range(bitmap.width):
+                    row[x // per_byte] |= bitmap[x, y] << (
+                        8 - bits - (x % per_byte) * bits
+                    )
+                file.write(row)
+        _remove(path)  # FAT cannot rename over an existing file
+        os.rename(temporary, path)
+    except OSError:
+        _remove(temporary)  # do not leave a partial face behind
+        return False
+    return True
+
+
+_shared_faces = {}
+
+
+class SharedFace:
+    """A rendered face used by one or more dials
+
+    :param displayio.Bitmap bitmap: the face bitmap
+    :param displayio.Palette palette: the face palette
+    :param list position_major_ticks: major tick angles of the face
+    :param list position_minor_ticks: minor tick angles of the face
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, bitmap, palette, position_major_ticks, position_minor_ticks):
+        self.bitmap = bitmap
+        self.palette = palette
+        self.position_major_ticks = position_major_ticks
+        self.position_minor_ticks = position_minor_ticks
+        self.references = 1
+
+
+def acquire_face(key):
+    """Return the :class:`SharedFace` registered under ``key``, adding a
+    reference, or `None` when there is none"""
+    face = _shared_faces.get(key)
+    if face is not None:
+        face.references += 1
+    return face
+
+
+def share_face(key, bitmap, palette, position_major_ticks, position_minor_ticks):
+    """Register a freshly rendered face under ``key``, with one reference"""
+    face = SharedFace(bitmap, palette, position_major_ticks, position_minor_ticks)
+    _shared_faces[key] = face
+    return face
+
+
+def release_face(key):
+    """Drop a reference to the face under ``key``, forgetting the face with the
+    last one"""
+    face = _shared_faces.get(key)
+    if face is None:
+        return
+    face.references -= 1
+    if face.references <= 0:
+        del _shared_faces[key]
+
+
+def shared_face_count():
+    """Number of faces currently shared"""
+    return len(_shared_faces)
@@ -0,0 +1,722 @@
+# SPDX-FileCopyrightText: 2023 Jose David Montoya
+#
+# SPDX-License-Identifier: MIT
+"""
+
+`headless`
+================================================================================
+In-memory stand-ins for the ``displayio``, ``vectorio``, ``bitmaptools``,
+``terminalio`` and ``adafruit_display_text`` subset used by the dial widgets,
+so a dial can be built, profiled and pixel-checked on plain CPython.
+
+* Author(s): Jose David Montoya
+
+Implementation Notes
+--------------------
+
+Call :func:`install` before importing :mod:`circuitpython_simple_dial.simple_dial`
+or :mod:`circuitpython_simple_dial.dial_needle`:
+
+.. code-block:: python
+
+    from circuitpython_simple_dial import headless
+
+    headless.install()
+
+    from circuitpython_simple_dial.simple_dial import Dial
+    from circuitpython_simple_dial.dial_needle import needle
+
+    dial = Dial(width=150, height=150)
+    needle(dial, value=30)
+    frame = headless.render(dial, 160, 160)
+    print(frame[75, 75])
+
+This module is meant for CPython only, it is never needed on a board.
+
+"""
+
+import math
+import sys
+from array import array
+from types import ModuleType
+
+# pylint: disable=too-many-arguments, too-many-locals, too-many-branches, invalid-name
+# pylint: disable=too-few-public-methods, too-many-instance-attributes, protected-access
+# pylint: disable=unused-argument, invalid-unary-operand-type
+
+
+class Bitmap:
+    """Stand-in for :class:`displayio.Bitmap`, stored in a flat array
+
+    :param int width: bitmap width in pixels
+    :param int height: bitmap height in pixels
+    :param int value_count: number of distinct values the bitmap holds
+    """
+
+    def __init__(self, width, height, value_count):
+        if width < 0 or height < 0:
+            raise ValueError("width and height must be positive")
+        if value_count < 1:
+            raise ValueError("value_count must be at least 1")
+        self.width = width
+        self.height = height
+        self.bits_per_value = 1
+        while (1 << self.bits_per_value) < value_count:
+            self.bits_per_value *= 2
+        if self.bits_per_value <= 8:
+            typecode = "B"
+        elif self.bits_per_value <= 16:
+            typecode = "H"
+        else:
+            typecode = "L"
+        self._max_value = (1 << self.bits_per_value) - 1
+        self._data = array(typecode, bytes(array(typecode).itemsize * width * height))
+
+    def _offset(self, index):
+        if isinstance(index, tuple):
+            x, y = index
+            if not (0 <= x < self.width and 0 <= y < self.height):
+                raise IndexError("pixel coordinates out of bounds")
+            return y * self.width + x
+        if not 0 <= index < self.width * self.height:
+            raise IndexError("pixel coordinates out of bounds")
+        return index
+
+    def __getitem__(self, index):
+        return self._data[self._offset(index)]
+
+    def __setitem__(self, index, value):
+        if not 0 <= value <= self._max_value:
+            raise ValueError("pixel value out of range")
+        self._data[self._offset(index)] = value
+
+    def __len__(self):
+        return self.width * self.height
+
+    def fill(self, value):
+        """Fill the whole bitmap with ``value``"""
+        if not 0 <= value <= self._max_value:
+            raise ValueError("pixel value out of range")
+        data = self._data
+        row = array(data.typecode, [value]) * self.width
+        for start in range(0, len(data), self.width or 1):
+            data[start : start + self.width] = row
+
+    @property
+    def nbytes(self):
+        """Bytes a board would use to store this bitmap"""
+        return (self.width * self.height * self.bits_per_value + 7) // 8
+
+
+class Palette:
+    """Stand-in for :class:`displayio.Palette`
+
+    :param int color_count: number of colors in the palette
+    """
+
+    def __init__(self, color_count):
+        self._colors = [0] * color_count
+        self._transparent = [False] * color_count
+
+    def __len__(self):
+        return len(self._colors)
+
+    def __getitem__(self, index):
+        return self._colors[index]
+
+    def __setitem__(self, index, color):
+        if isinstance(color, (tuple, list)):
+            color = (color[0] << 16) | (color[1] << 8) | color[2]
+        self._colors[index] = color & 0xFFFFFF
+
+    def make_transparent(self, index):
+        """Mark ``index`` as transparent"""
+        self._transparent[index] = True
+
+    def make_opaque(self, index):
+        """Mark ``index`` as opaque"""
+        self._transparent[index] = False
+
+    def is_transparent(self, index):
+        """Whether ``index`` is transparent"""
+        return self._transparent[index]
+
+
+class TileGrid:
+    """Stand-in for :class:`displayio.TileGrid`
+
+    :param Bitmap bitmap: source bitmap holding the tiles
+    :param Palette pixel_shader: palette used to color the bitmap
+    :param int width: grid width in tiles. Defaults to :const:`1`
+    :param int height: grid height in tiles. Defaults to :const:`1`
+    :param int tile_width: tile width in pixels, defaults to the bitmap width
+    :param int tile_height: tile height in pixels, defaults to the bitmap height
+    :param int default_tile: initial tile index. Defaults to :const:`0`
+    :param int x: x position
+    :param int y: y position
+    """
+
+    def __init__(
+        self,
+        bitmap,
+        *,
+        pixel_shader,
+        width=1,
+        height=1,
+        tile_width=None,
+        tile_height=None,
+        default_tile=0,
+        x=0,
+        y=0,
+    ):
+        if tile_width is None:
+            tile_width = bitmap.width
+        if tile_height is None:
+            tile_height = bitmap.height
+        if bitmap.width % tile_width or bitmap.height % tile_height:
+            raise ValueError("Tile size must exactly divide the bitmap size")
+        self.bitmap = bitmap
+        self.pixel_shader = pixel_shader
+        self.width = width
+        self.height = height
+        self.tile_width = tile_width
+        self.tile_height = tile_height
+        self.x = x
+        self.y = y
+        self.hidden = False
+        self.flip_x = False
+        self.flip_y = False
+        self._tiles = [default_tile] * (width * height)
+
+    def _offset(self, index):
+        if isinstance(index, tuple):
+            return index[1] * self.width + index[0]
+        return index
+
+    def __getitem__(self, index):
+        return self._tiles[self._offset(index)]
+
+    def __setitem__(self, index, tile):
+        tiles_per_row = self.bitmap.width // self.tile_width
+        tile_count = tiles_per_row * (self.bitmap.height // self.tile_height)
+        if not 0 <= tile < tile_count:
+            raise ValueError("Tile index out of bounds")
+        self._tiles[self._offset(index)] = tile
+
+
+class Group:
+    """Stand-in for :class:`displayio.Group`
+
+    :param int scale: integer scale factor. Defaults to :const:`1`
+    :param int x: x position
+    :param int y: y position
+    """
+
+    def __init__(self, *, scale=1, x=0, y=0):
+        self.scale = scale
+        self.x = x
+        self.y = y
+        self.hidden = False
+        self._layers = []
+
+    def append(self, layer):
+        """Append ``layer`` to the group"""
+        self._layers.append(layer)
+
+    def insert(self, index, layer):
+        """Insert ``layer`` at ``index``"""
+        self._layers.insert(index, layer)
+
+    def index(self, layer):
+        """Index of ``layer`` in the group"""
+        return self._layers.index(layer)
+
+    def pop(self, i=-1):
+        """Remove and return the layer at ``i``"""
+        return self._layers.pop(i)
+
+    def remove(self, layer):
+        """Remove ``layer`` from the group"""
+        self._layers.remove(layer)
+
+    def __len__(self):
+        return len(self._layers)
+
+    def __getitem__(self, index):
+        return self._layers[index]
+
+    def __setitem__(self, index, layer):
+        self._layers[index] = layer
+
+    def __delitem__(self, index):
+        del self._layers[index]
+
+    def __iter__(self):
+        return iter(self._layers)
+
+    def __contains__(self, layer):
+        return layer in self._layers
+
+
+class Polygon:
+    """Stand-in for :class:`vectorio.Polygon`
+
+    ``updates`` counts the assignments to ``points``, each of which would
+    dirty the polygon area on a board.
+
+    :param Palette pixel_shader: palette used to color the polygon
+    :param list points: polygon vertices as ``(x, y)`` pairs
+    :param int x: x position
+    :param int y: y position
+    :param int color_index: palette index used to fill. Defaults to :const:`0`
+    """
+
+    def __init__(self, *, pixel_shader, points, x=0, y=0, color_index=0):
+        self.pixel_shader = pixel_shader
+        self.x = x
+        self.y = y
+        self.color_index = color_index
+        self.hidden = False
+        self.updates = 0
+        self._points = []
+        self.points = points
+        self.updates = 0
+
+    @property
+    def points(self):
+        """Polygon vertices, as a list of ``(x, y)`` tuples"""
+        return list(self._points)
+
+    @points.setter
+    def points(self, points):
+        if len(points) < 3:
+            raise ValueError("Polygon needs at least 3 points")
+        self._points = [(int(point[0]), int(point[1])) for point in points]
+        self.updates += 1
+
+    def contains(self, x, y):
+        """Whether pixel ``(x, y)``, in polygon coordinates, is filled"""
+        points = self._points
+        inside = False
+        j = len(points) - 1
+        for i, (x_i, y_i) in enumerate(points):
+            x_j, y_j = points[j]
+            if (y_i > y) != (y_j > y):
+                if x < x_i + (y - y_i) * (x_j - x_i) / (y_j - y_i):
+                    inside = not inside
+            j = i
+        return inside
+
+
+class _Glyph:
+    def __init__(self, bitmap, width, height, dx, dy, shift_x):
+        self.bitmap = bitmap
+        self.tile_index = 0
+        self.width = width
+        self.height = height
+        self.dx = dx
+        self.dy = dy
+        self.shift_x = shift_x
+        self.shift_y = 0
+
+
+class BuiltinFont:
+    """Stand-in for ``terminalio.FONT``, a fixed 6x12 cell font whose glyph
+    pixels are derived from the character code, so different strings
+    rasterize differently."""
+
+    def __init__(self):
+        self._glyphs = {}
+
+    @staticmethod
+    def get_bounding_box():
+        """Font cell size as ``(width, height)``"""
+        return (6, 12)
+
+    def get_glyph(self, codepoint):
+        """Glyph for ``codepoint``"""
+        glyph = self._glyphs.get(codepoint)
+        if glyph is None:
+            bitmap = Bitmap(6, 12, 2)
+            if codepoint != 32:
+                for y in range(2, 10):
+                    for x in range(5):
+                        if (codepoint >> ((x + y) % 7)) & 1 or x in (0, 4):
+                            bitmap[x, y] = 1
+            glyph = _Glyph(bitmap, 6, 12, 0, 0, 6)
+            self._glyphs[codepoint] = glyph
+        return glyph
+
+
+class Label:
+    """Stand-in for ``adafruit_display_text.bitmap_label.Label``, holding the
+    rendered text in ``bitmap`` with index 1 for the glyph pixels
+
+    :param font: font, any object with ``get_bounding_box`` and ``get_glyph``
+    :param str text: text to render
+    """
+
+    def __init__(self, font, *, text="", **kwargs):
+        self.font = font
+        self.text = text
+        cell_width, cell_height = font.get_bounding_box()[:2]
+        self.bitmap = Bitmap(max(1, cell_width * len(text)), cell_height, 2)
+        for i, char in enumerate(text):
+            glyph = font.get_glyph(ord(char))
+            if glyph is None:
+                continue
+            for y in range(min(glyph.bitmap.height, cell_height)):
+                for x in range(min(glyph.bitmap.width, cell_width)):
+                    if glyph.bitmap[x, y]:
+                        self.bitmap[i * cell_width + x, y] = 1
+
+
+def rotozoom(
+    dest_bitmap,
+    source_bitmap,
+    *,
+    ox=None,
+    oy=None,
+    dest_clip0=None,
+    dest_clip1=None,
+    px=None,
+    py=None,
+    source_clip0=None,
+    source_clip1=None,
+    angle=0.0,
+    scale=1.0,
+    skip_index=None,
+):
+    """Stand-in for :func:`bitmaptools.rotozoom`, following the inverse
+    mapping of the CircuitPython core implementation pixel for pixel"""
+    if ox is None:
+        ox = dest_bitmap.width // 2
+    if oy is None:
+        oy = dest_bitmap.height // 2
+    if px is None:
+        px = source_bitmap.width // 2
+    if py is None:
+        py = source_bitmap.height // 2
+    dest_clip0_x, dest_clip0_y = dest_clip0 or (0, 0)
+    dest_clip1_x, dest_clip1_y = dest_clip1 or (dest_bitmap.width, dest_bitmap.height)
+    source_clip0_x, source_clip0_y = source_clip0 or (0, 0)
+    source_clip1_x, source_clip1_y = source_clip1 or (
+        source_bitmap.width,
+        source_bitmap.height,
+    )
+
+    sin_angle = math.sin(angle)
+    cos_angle = math.cos(angle)
+    width = source_bitmap.width
+    height = source_bitmap.height
+
+    minx, maxx = dest_clip1_x, dest_clip0_x
+    miny, maxy = dest_clip1_y, dest_clip0_y
+    for corner_x, corner_y in (
+        (-px, -py),
+        (width - px, -py),
+        (width - px, height - py),
+        (-px, height - py),
+    ):
+        dx = int((cos_angle * corner_x - sin_angle * corner_y) * scale + ox)
+        dy = int((sin_angle * corner_x + cos_angle * corner_y) * scale + oy)
+        minx = min(minx, dx)
+        maxx = max(maxx, dx)
+        miny = min(miny, dy)
+        maxy = max(maxy, dy)
+
+    minx = max(minx, dest_clip0_x)
+    maxx = min(maxx, dest_clip1_x - 1)
+    miny = max(miny, dest_clip0_y)
+    maxy = min(maxy, dest_clip1_y - 1)
+
+    dv_col = cos_angle / scale
+    du_col = sin_angle / scale
+    du_row = dv_col
+    dv_row = -du_col
+
+    start_u = px - (ox * dv_col + oy * du_col)
+    start_v = py - (ox * dv_row + oy * du_row)
+    row_u = start_u + miny * du_col + minx * dv_col
+    row_v = start_v + miny * du_row + minx * dv_row
+
+    source = source_bitmap
+    dest = dest_bitmap
+    for y in range(miny, maxy + 1):
+        u = row_u
+        v = row_v
+        for x in range(minx, maxx + 1):
+            if (
+                source_clip0_x <= u < source_clip1_x
+                and source_clip0_y <= v < source_clip1_y
+            ):
+                color = source[int(u), int(v)]
+                if skip_index is None or color != skip_index:
+                    dest[x, y] = color
+            u += du_row
+            v += dv_row
+        row_u += du_col
+        row_v += dv_col
+
+
+def fill_region(dest_bitmap, x1, y1, x2, y2, value):
+    """Stand-in for :func:`bitmaptools.fill_region`, ``x2``/``y2`` exclusive"""
+    if not 0 <= value <= dest_bitmap._max_value:
+        raise ValueError("pixel value out of range")
+    x1, x2 = max(0, min(x1, x2)), min(dest_bitmap.width, max(x1, x2))
+    y1, y2 = max(0, min(y1, y2)), min(dest_bitmap.height, max(y1, y2))
+    if x2 <= x1:
+        return
+    data = dest_bitmap._data
+    row = array(data.typecode, [value]) * (x2 - x1)
+    for y in range(y1, y2):
+        start = y * dest_bitmap.width + x1
+        data[start : start + x2 - x1] = row
+
+
+def blit(
+    dest_bitmap,
+    source_bitmap,
+    x,
+    y,
+    *,
+    x1=0,
+    y1=0,
+    x2=None,
+    y2=None,
+    skip_source_index=None,
+    skip_dest_index=None,
+):
+    """Stand-in for :func:`bitmaptools.blit`, available from CircuitPython 9"""
+    if x2 is None:
+        x2 = source_bitmap.width
+    if y2 is None:
+        y2 = source_bitmap.height
+    if not (0 <= x <= dest_bitmap.width and 0 <= y <= dest_bitmap.height):
+        raise ValueError("out of range of target")
+    for source_y in range(y1, y2):
+        dest_y = y + source_y - y1
+        if dest_y >= dest_bitmap.height:
+            break
+        for source_x in range(x1, x2):
+            dest_x = x + source_x - x1
+            if dest_x >= dest_bitmap.width:
+                break
+            value = source_bitmap[source_x, source_y]
+            if value == skip_source_index:
+                continue
+            if (
+                skip_dest_index is not None
+                and dest_bitmap[dest_x, dest_y] == skip_dest_index
+            ):
+                continue
+            dest_bitmap[dest_x, dest_y] = value
+
+
+def draw_circle(dest_bitmap, x, y, radius, value):
+    """Stand-in for :func:`bitmaptools.draw_circle`, available from
+    CircuitPython 8.1"""
+    x_i = 0
+    y_i = radius
+    d = 3 - 2 * radius
+    while x_i <= y_i:
+        for point_x, point_y in (
+            (x + x_i, y + y_i),
+            (x - x_i, y - y_i),
+            (x + x_i, y - y_i),
+            (x - x_i, y + y_i),
+            (x + y_i, y + x_i),
+            (x - y_i, y + x_i),
+            (x - y_i, y - x_i),
+            (x + y_i, y - x_i),
+        ):
+            if 0 <= point_x < dest_bitmap.width and 0 <= point_y < dest_bitmap.height:
+                dest_bitmap[point_x, point_y] = value
+        if d <= 0:
+            d = d + (4 * x_i) + 6
+        else:
+            d = d + 4 * (x_i - y_i) + 10
+            y_i = y_i - 1
+        x_i = x_i + 1
+
+
+def readinto(
+    bitmap,
+    file,
+    bits_per_pixel,
+    element_size=1,
+    reverse_pixels_in_element=False,
+    swap_bytes_in_element=False,
+    reverse_rows=False,
+):
+    """Stand-in for :func:`bitmaptools.readinto`. As in the core, the first pixel
+    of a byte is in its least significant bits unless ``reverse_pixels_in_element``
+    is set, and pixels wider than a byte are little endian."""
+    if bits_per_pixel not in (1, 2, 4, 8, 16, 24, 32):
+        raise ValueError("bits_per_pixel must be 1, 2, 4, 8, 16, 24 or 32")
+    if element_size not in (1, 2, 4):
+        raise ValueError("element_size must be 1, 2 or 4")
+    mask = (1 << bits_per_pixel) - 1
+    element_bits = element_size * 8
+    row_bytes = (
+        (bitmap.width * bits_per_pixel + element_bits - 1) // element_bits
+    ) * element_size
+    for row in range(bitmap.height):
+        data = file.read(row_bytes)
+        if len(data) != row_bytes:
+            raise EOFError("file too short for the bitmap")
+        if swap_bytes_in_element and element_size > 1:
+            data = b"".join(
+                data[i : i + element_size][::-1]
+                for i in range(0, row_bytes, element_size)
+            )
+        y = bitmap.height - 1 - row if reverse_rows else row
+        for x in range(bitmap.width):
+            if bits_per_pixel < 8:
+                per_byte = 8 // bits_per_pixel
+                offset = x % per_byte
+                if reverse_pixels_in_element:
+                    offset = per_byte - 1 - offset
+                value = (data[x // per_byte] >> (offset * bits_per_pixel)) & mask
+            else:
+                size = bits_per_pixel // 8
+                value = int.from_bytes(data[x * size : (x + 1) * size], "little")
+            bitmap[x, y] = value & bitmap._max_value
+
+
+def _composite(frame, layer, x_offset, y_offset, scale):
+    if layer.hidden:
+        return
+    if isinstance(layer, Group):
+        for child in layer:
+            _composite(
+                frame,
+                child,
+                x_offset + layer.x * scale,
+                y_offset + layer.y * scale,
+                scale * layer.scale,
+            )
+    elif isinstance(layer, TileGrid):
+        _composite_tilegrid(frame, layer, x_offset, y_offset, scale)
+    elif isinstance(layer, Polygon):
+        _composite_polygon(frame, layer, x_offset, y_offset, scale)
+
+
+def _composite_tilegrid(frame, grid, x_offset, y_offset, scale):
+    bitmap = grid.bitmap
+    palette = grid.pixel_shader
+    tiles_per_row = bitmap.width // grid.tile_width
+    # flip_x and flip_y mirror the whole grid
+    last_x = grid.width * grid.tile_width - 1
+    last_y = grid.height * grid.tile_height - 1
+    for tile_y in range(grid.height):
+        for tile_x in range(grid.width):
+            tile = grid[tile_x, tile_y]
+            source_x = (tile % tiles_per_row) * grid.tile_width
+            source_y = (tile // tiles_per_row) * grid.tile_height
+            for y in range(grid.tile_height):
+                for x in range(grid.tile_width):
+                    grid_x = tile_x * grid.tile_width + x
+                    grid_y = tile_y * grid.tile_height + y
+                    if grid.flip_x:
+                        grid_x = last_x - grid_x
+                    if grid.flip_y:
+                        grid_y = last_y - grid_y
+                    index = bitmap[source_x + x, source_y + y]
+                    if palette.is_transparent(index):
+                        continue
+                    _put(
+                        frame,
+                        x_offset + (grid.x + grid_x) * scale,
+                        y_offset + (grid.y + grid_y) * scale,
+                        scale,
+                        palette[index],
+                    )
+
+
+def _composite_polygon(frame, polygon, x_offset, y_offset, scale):
+    palette = polygon.pixel_shader
+    if palette.is_transparent(polygon.color_index):
+        return
+    points = polygon.points
+    min_x = min(point[0] for point in points)
+    max_x = max(point[0] for point in points)
+    min_y = min(point[1] for point in points)
+    max_y = max(point[1] for point in points)
+    color = palette[polygon.color_index]
+    for y in range(min_y, max_y + 1):
+        for x in range(min_x, max_x + 1):
+            if polygon.contains(x, y):
+                _put(
+                    frame,
+                    x_offset + (polygon.x + x) * scale,
+                    y_offset + (polygon.y + y) * scale,
+                    scale,
+                    color,
+                )
+
+
+def _put(frame, x, y, scale, color):
+    for y_i in range(y, y + scale):
+        for x_i in range(x, x + scale):
+            if 0 <= x_i < frame.width and 0 <= y_i < frame.height:
+                frame[x_i, y_i] = color
+
+
+def render(root, width, height, background=0x000000):
+    """Composite ``root`` and its children into a new ``width`` x ``height``
+    :class:`Bitmap` holding 24-bit colors, the way a display would show them
+
+    :param root: a :class:`Group`, :class:`TileGrid` or :class:`Polygon`
+    :param int width: frame width in pixels
+    :param int height: frame height in pixels
+    :param int background: color of the pixels nothing is drawn on.
+     Defaults to :const:`0x000000`
+    """
+    frame = Bitmap(width, height, 1 << 24)
+    if background:
+        frame.fill(background)
+    _composite(frame, root, 0, 0, 1)
+    return frame
+
+
+FONT = BuiltinFont()
+
+
+def install():
+    """Register the stand-in modules in :data:`sys.modules` so the widgets
+    import them instead of the board modules. Returns the modules by name."""
+    displayio = ModuleType("displayio")
+    displayio.Bitmap = Bitmap
+    displayio.Palette = Palette
+    displayio.TileGrid = TileGrid
+    displayio.Group = Group
+
+    vectorio = ModuleType("vectorio")
+    vectorio.Polygon = Polygon
+
+    bitmaptools = ModuleType("bitmaptools")
+    bitmaptools.rotozoom = rotozoom
+    bitmaptools.fill_region = fill_region
+    bitmaptools.readinto = readinto
+    bitmaptools.draw_circle = draw_circle
+    bitmaptools.blit = blit
+
+    terminalio = ModuleType("terminalio")
+    terminalio.FONT = FONT
+
+    display_text = ModuleType("adafruit_display_text")
+    bitmap_label = ModuleType("adafruit_display_text.bitmap_label")
+    bitmap_label.Label = Label
+    display_text.bitmap_label = bitmap_label
+
+    modules = {
+        "displayio": displayio,
+        "vectorio": vectorio,
+        "bitmaptools": bitmaptools,
+        "terminalio": terminalio,
+        "adafruit_display_text": display_text,
+        "adafruit_display_text.bitmap_label": bitmap_label,
+    }
+    sys.modules.update(modules)
+    return modules
@@ -0,0 +1,207 @@
+# SPDX-FileCopyrightText: 2023 Jose David Montoya
+#
+# SPDX-License-Identifier: MIT
+"""
+
+`label_cache`
+================================================================================
+Bounded cache of rendered tick label bitmaps, shared by the dials that are
+given the same :class:`LabelCache`.
+
+* Author(s): Jose David Montoya
+
+Implementation Notes
+--------------------
+
+By default the cache keeps the text bitmap of each label, keyed by font and
+text, so the glyphs are rasterized once and only the rotation is done for
+every dial. With ``rotated=True`` it keeps the rotated and scaled result,
+keyed by font, text, scale and angle, and a hit is a single blit. Rotating
+into a bitmap of its own, rotozoom can round the label edges one pixel apart
+from the label rotated straight into the face, when the scale puts an edge
+exactly on a pixel.
+
+The least recently used bitmaps are dropped when the cached bitmaps use more
+than ``max_bytes``.
+
+"""
+
+import math
+import displayio
+import bitmaptools
+from adafruit_display_text import bitmap_label
+
+# pylint: disable=too-many-arguments, invalid-name
+
+# pixels outside the rotated label in a pre-rotated bitmap, never blitted
+_OUTSIDE = 3
+
+
+def _bitmap_bytes(bitmap):
+    return (bitmap.width * bitmap.height * bitmap.bits_per_value + 7) // 8
+
+
+class LabelCache:
+    """LRU cache of tick label bitmaps
+
+    :param int max_bytes: most bytes used by the cached bitmaps. Defaults to :const:`8192`
+    :param bool rotated: Set to True to cache the rotated and scaled labels instead
+     of the text bitmaps. Defaults to `False`
+
+    .. code-block:: python
+
+        labels = LabelCache(max_bytes=4096)
+        gauges = [Dial(x=i * 80, width=80, height=80, label_cache=labels) for i in range(4)]
+        print(labels.hits, labels.misses)
+
+    """
+
+    def __init__(self, max_bytes=8192, rotated=False):
+        self.max_bytes = max_bytes
+        self.rotated = rotated
+        self._entries = {}
+        self._order = []  # least recently used first
+        self.nbytes = 0
+        """Bytes used by the cached bitmaps"""
+        self.hits = 0
+        """Number of labels found in the cache"""
+        self.misses = 0
+        """Number of labels that had to be rendered"""
+
+    def _get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._order.remove(key)
+        self._order.append(key)
+        return entry
+
+    def _put(self, key, font, entry, size):
+        # the keys hold id(font), the entry keeps the font alive so that id is
+        # not given to another font while the entry is cached
+        if size > self.max_bytes:
+            return
+        while self._order and self.nbytes + size > self.max_bytes:
+            oldest = self._order.pop(0)
+            self.nbytes -= self._entries.pop(oldest)[-1]
+        self._entries[key] = entry + (font, size)
+        self._order.append(key)
+        self.nbytes += size
+
+    def clear(self):
+        """Drop every cached bitmap"""
+        self._entries = {}
+        self._order = []
+        self.nbytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def text_bitmap(self, font, text):
+        """The bitmap of ``text`` in ``font``, with the glyph pixels set to 1"""
+        key = (id(font), text)
+        entry = self._get(key)
+        if entry is not None:
+            return entry[0]
+        bitmap = bitmap_label.Label(font, text=text).bitmap
+        self._put(key, font, (bitmap,), _bitmap_bytes(bitmap))
+        return bitmap
+
+    def draw(self, dest_bitmap, font, text, ox, oy, angle, scale):
+        """Draw the label centered on ``(ox, oy)``, like ``bitmaptools.rotozoom``
+        does with the text bitmap
+
+        :param displayio.Bitmap dest_bitmap: the dial bitmap
+        :param font: label font
+        :param str text: label text
+        :param int ox: x of the label center in ``dest_bitmap``
+        :param int oy: y of the label center in ``dest_bitmap``
+        :param float angle: rotation in radians
+        :param float scale: label scale
+        """
+        if not self.rotated:
+            bitmap = self.text_bitmap(font, text)
+            bitmaptools.rotozoom(
+                dest_bitmap,
+                ox=ox,
+                oy=oy,
+                source_bitmap=bitmap,
+                px=round(bitmap.width // 2),
+                py=round(bitmap.height // 2),
+                angle=angle,
+                scale=scale,
+            )
+            return
+
+        key = (id(font), text, scale, angle)
+        entry = self._get(key)
+        if entry is None:
+            entry = self._rotate(font, text, angle, scale)
+            self._put(key, font, entry, _bitmap_bytes(entry[0]))
+        rotated, center_x, center_y = entry[:3]
+        _blit(dest_bitmap, rotated, ox - center_x, oy - center_y)
+
+    def _rotate(self, font, text, angle, scale):
+        # rotozoom the text into a bitmap of its own, the pixels it does not
+        # cover keep the _OUTSIDE value so the blit leaves the dial untouched
+        source = bitmap_label.Label(font, text=text).bitmap
+        px = round(source.width // 2)
+        py = round(source.height // 2)
+        reach = (
+            math.ceil(
+                scale
+                * math.sqrt(
+                    max(px, source.width - px) ** 2 + max(py, source.height - py) ** 2
+                )
+            )
+            + 1
+        )
+        size = 2 * reach + 1
+        rotated = displayio.Bitmap(size, size, 4)
+        rotated.fill(_OUTSIDE)
+        bitmaptools.rotozoom(
+            rotated,
+            ox=reach,
+            oy=reach,
+            source_bitmap=source,
+            px=px,
+            py=py,
+            angle=angle,
+            scale=scale,
+        )
+        return (rotated, reach, reach)
+
+
+def _blit(dest_bitmap, source_bitmap, x, y):
+    # copy source_bitmap at (x, y), clipped to dest_bitmap, skipping _OUTSIDE
+    x1 = max(0, -x)
+    y1 = max(0, -y)
+    x2 = min(source_bitmap.width, dest_bitmap.width - x)
+    y2 = min(source_bitmap.height, dest_bitmap.height - y)
+    if x1 >= x2 or y1 >= y2:
+        return
+    if hasattr(bitmaptools, "blit"):  # CircuitPython 9
+        bitmaptools.blit(
+            dest_bitmap,
+            source_bitmap,
+            x + x1,
+            y + y1,
+            x1=x1,
+            y1=y1,
+            x2=x2,
+            y2=y2,
+            skip_source_index=_OUTSIDE,
+        )
+    else:
+        dest_bitmap.blit(
+            x + x1,
+            y + y1,
+            source_bitmap,
+            x1=x1,
+            y1=y1,
+            x2=x2,
+            y2=y2,
+            skip_index=_OUTSIDE,
+        )
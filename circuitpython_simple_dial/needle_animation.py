@@ -0,0 +1,178 @@
+# SPDX-FileCopyrightText: 2023 Jose David Montoya
+#
+# SPDX-License-Identifier: MIT
+"""
+
+`needle_animation`
+================================================================================
+Time-based needle animation with easing, paced to what the display can show.
+
+* Author(s): Jose David Montoya
+
+Implementation Notes
+--------------------
+
+The animator computes the needle position from a monotonic clock, so the
+animation takes the requested duration whatever the refresh rate. It computes
+at most ``frame_rate`` positions per second; when a refresh overran, the frames
+that could not be shown are dropped instead of being computed late.
+
+The default clock counts integer nanoseconds with ``time.monotonic_ns`` where
+the port has it. The float seconds of ``time.monotonic`` only keep about 20 ms
+of resolution after a day on the 30 bit floats of CircuitPython. Only time
+differences are turned into floats, and those stay small.
+
+"""
+
+import time
+
+# pylint: disable=too-many-instance-attributes, too-many-arguments
+
+if hasattr(time, "monotonic_ns"):
+    ticks = time.monotonic_ns
+    TICKS_PER_SECOND = 1000000000
+else:
+    ticks = time.monotonic
+    TICKS_PER_SECOND = 1
+"""Units per second of :func:`ticks`, the monotonic clock of the animations and
+the dial pacing: nanoseconds where ``time.monotonic_ns`` exists, else seconds"""
+
+
+def linear(progress):
+    """Constant speed"""
+    return progress
+
+
+def ease_in_quad(progress):
+    """Start slow, then accelerate"""
+    return progress * progress
+
+
+def ease_out_quad(progress):
+    """Start fast, then decelerate"""
+    return progress * (2 - progress)
+
+
+def ease_in_out_quad(progress):
+    """Accelerate until halfway, then decelerate"""
+    if progress < 0.5:
+        return 2 * progress * progress
+    return -1 + (4 - 2 * progress) * progress
+
+
+def ease_out_cubic(progress):
+    """Start fast, then decelerate smoothly"""
+    progress -= 1
+    return progress * progress * progress + 1
+
+
+class NeedleAnimator:
+    """Moves a needle to a target value over a given duration
+
+    :param needle_object: the needle to move
+    :param float frame_rate: most needle positions computed per second, usually the
+     display refresh rate. Defaults to :const:`30`
+    :param easing: function mapping the animation progress, from 0.0 to 1.0, to the
+     fraction of the way the needle has moved. Defaults to :func:`ease_in_out_quad`
+    :param clock: function returning the time in seconds. Defaults to :func:`ticks`,
+     counted in :data:`TICKS_PER_SECOND`
+
+    .. code-block:: python
+
+        animator = NeedleAnimator(my_needle, frame_rate=20)
+        animator.animate_to(75, duration=1.0)
+        while True:
+            if animator.update():
+                display.refresh()
+
+    """
+
+    def __init__(
+        self, needle_object, frame_rate=30, easing=ease_in_out_quad, clock=None
+    ):
+        self._needle = needle_object
+        self._easing = easing
+        if clock is None:
+            self._clock = ticks
+            self._ticks_per_second = TICKS_PER_SECOND
+        else:
+            self._clock = clock
+            self._ticks_per_second = 1
+        self._frame_interval = self._ticks_per_second / frame_rate
+
+        self._animation_easing = easing
+        self._start_value = needle_object.value
+        self._target = needle_object.value
+        self._start_time = 0
+        self._duration = 0
+        self._animating = False
+        self._last_frame = None
+
+        self.frames = 0
+        """Number of positions computed"""
+        self.dropped_frames = 0
+        """Number of frames skipped because an update came late"""
+
+    def animate_to(self, target, duration=0.5, easing=None):
+        """Start moving the needle from its current value to ``target``
+
+        :param float target: the final needle value
+        :param float duration: animation length, in seconds. Defaults to :const:`0.5`
+        :param easing: easing function for this animation, defaults to the animator one
+        """
+        if not self._animating:
+            # the time since the last frame of a previous animation is idle
+            # time, not frames that came late
+            self._last_frame = None
+        self._start_value = self._needle.value
+        self._target = target
+        self._start_time = self._clock()
+        self._duration = duration * self._ticks_per_second
+        if easing is None:
+            self._animation_easing = self._easing
+        else:
+            self._animation_easing = easing
+        self._animating = True
+        if duration <= 0:
+            self._finish()
+
+    def _finish(self):
+        self._needle.value = self._target
+        self._animating = False
+        self.frames += 1
+
+    @property
+    def animating(self):
+        """`True` while the needle has not reached the target"""
+        return self._animating
+
+    @property
+    def target(self):
+        """The value the needle is moving to"""
+        return self._target
+
+    def update(self):
+        """Move the needle to where it should be now. Call it once per main loop
+        iteration, it returns `True` when the needle was moved and the display
+        needs a refresh, and `False` when no new frame is due yet."""
+        if not self._animating:
+            return False
+        now = self._clock()
+        if self._last_frame is not None:
+            elapsed = now - self._last_frame
+            if elapsed < self._frame_interval:
+                return False
+            late = int(elapsed / self._frame_interval) - 1
+            if late > 0:
+                self.dropped_frames += late
+        self._last_frame = now
+
+        progress = (now - self._start_time) / self._duration
+        if progress >= 1:
+            self._finish()
+            return True
+        self._needle.value = self._start_value + (
+            self._target - self._start_value
+        ) * self._animation_easing(progress)
+        self.frames += 1
+        return True
@@ -23,13 +23,137 @@ Implementation Notes
 # pylint: disable=too-many-lines, too-many-instance-attributes, too-many-arguments
 # pylint: disable=too-many-locals, too-many-statements, attribute-defined-outside-init
 # pylint: disable=unused-argument, unsubscriptable-object, undefined-variable, invalid-name
-# pylint: disable=invalid-unary-operand-type
+# pylint: disable=invalid-unary-operand-type, protected-access
 
 import math
 import displayio
 from terminalio import FONT as terminalio_FONT
 from adafruit_display_text import bitmap_label
 import bitmaptools
+from circuitpython_simple_dial.face_cache import (
+    face_key,
+    face_path,
+    load_face,
+    save_face,
+    acquire_face,
+    share_face as _register_face,
+    release_face,
+)
+from circuitpython_simple_dial.needle_animation import TICKS_PER_SECOND, ticks
+
+
+def _draw_circle_spans(bitmap, center_x, center_y, radius, value):
+    # Midpoint circle, same pixels as bitmaptools.draw_circle. The octant points
+    # sharing a row (or a column, once mirrored) are written as one span with
+    # fill_region, instead of one pixel write per point and octant.
+    fill_region = bitmaptools.fill_region
+    x = 0
+    y = radius
+    d = 3 - 2 * radius
+    run_start = 0
+    while x <= y:
+        if d <= 0:
+            d = d + (4 * x) + 6
+            next_y = y
+        else:
+            d = d + 4 * (x - y) + 10
+            next_y = y - 1
+        if next_y != y or x + 1 > next_y:
+            # the run run_start..x at this y ends here, draw it in all octants
+            x_0 = center_x + run_start
+            x_1 = center_x + x + 1
+            x_2 = center_x - x
+            x_3 = center_x - run_start + 1
+            y_0 = center_y + run_start
+            y_1 = center_y + x + 1
+            y_2 = center_y - x
+            y_3 = center_y - run_start + 1
+            fill_region(bitmap, x_0, center_y + y, x_1, center_y + y + 1, value)
+            fill_region(bitmap, x_2, center_y + y, x_3, center_y + y + 1, value)
+            fill_region(bitmap, x_0, center_y - y, x_1, center_y - y + 1, value)
+            fill_region(bitmap, x_2, center_y - y, x_3, center_y - y + 1, value)
+            fill_region(bitmap, center_x + y, y_0, center_x + y + 1, y_1, value)
+            fill_region(bitmap, center_x + y, y_2, center_x + y + 1, y_3, value)
+            fill_region(bitmap, center_x - y, y_0, center_x - y + 1, y_1, value)
+            fill_region(bitmap, center_x - y, y_2, center_x - y + 1, y_3, value)
+            run_start = x + 1
+        y = next_y
+        x = x + 1
+
+
+def fill_rotated_rect(bitmap, ox, oy, px, width, length, angle, value):
+    """Fill the pixels ``bitmaptools.rotozoom`` would cover when rotating a solid
+    ``width`` by ``length`` bitmap by ``angle`` around its ``(px, 0)`` point
+    placed at ``(ox, oy)``, one ``fill_region`` span per row. Draws the
+    ``"polygon"`` ticks and the sprite needle frames.
+
+    :param displayio.Bitmap bitmap: bitmap to draw on, clipped to its size
+    :param float ox: x of the rotation point in ``bitmap``
+    :param float oy: y of the rotation point in ``bitmap``
+    :param float px: x of the rotation point in the rectangle
+    :param int width: rectangle width, in pixels
+    :param int length: rectangle length, in pixels
+    :param float angle: clockwise rotation, in radians
+    :param int value: color index to fill with
+    """
+    # On each row, the pixels whose inverse mapped (u, v) falls in the source
+    # rectangle form one interval.
+    sin_angle = math.sin(angle)
+    cos_angle = math.cos(angle)
+
+    # bounding box of the rotated corners, truncated like rotozoom does
+    min_x = max_x = min_y = max_y = None
+    for corner_x, corner_y in (
+        (-px, 0),
+        (width - px, 0),
+        (width - px, length),
+        (-px, length),
+    ):
+        dx = int(cos_angle * corner_x - sin_angle * corner_y + ox)
+        dy = int(sin_angle * corner_x + cos_angle * corner_y + oy)
+        if min_x is None:
+            min_x = max_x = dx
+            min_y = max_y = dy
+        else:
+            min_x = min(min_x, dx)
+            max_x = max(max_x, dx)
+            min_y = min(min_y, dy)
+            max_y = max(max_y, dy)
+    min_x = max(min_x, 0)
+    max_x = min(max_x, bitmap.width - 1)
+    min_y = max(min_y, 0)
+    max_y = min(max_y, bitmap.height - 1)
+
+    for y in range(min_y, max_y + 1):
+        # 0 <= u < width with u = row_u + cos * (x - ox)
+        row_u = px + sin_angle * (y - oy)
+        start = min_x
+        end = max_x
+        if cos_angle > 0:
+            start = max(start, math.ceil(ox - row_u / cos_angle))
+            end = min(end, math.ceil(ox + (width - row_u) / cos_angle) - 1)
+        elif cos_angle < 0:
+            start = max(start, math.floor(ox + (width - row_u) / cos_angle) + 1)
+            end = min(end, math.floor(ox - row_u / cos_angle))
+        elif not 0 <= row_u < width:
+            continue
+        # 0 <= v < length with v = row_v - sin * (x - ox)
+        row_v = cos_angle * (y - oy)
+        if sin_angle < 0:
+            start = max(start, math.ceil(ox + row_v / sin_angle))
+            end = min(end, math.ceil(ox - (length - row_v) / sin_angle) - 1)
+        elif sin_angle > 0:
+            start = max(start, math.floor(ox - (length - row_v) / sin_angle) + 1)
+            end = min(end, math.floor(ox + row_v / sin_angle))
+        elif not 0 <= row_v < length:
+            continue
+        if start <= end:
+            bitmaptools.fill_region(bitmap, start, y, end + 1, y + 1, value)
+
+
+# face changes waiting for _update_face
+_FACE_PALETTE = 1
+_FACE_PIXELS = 2
 
 
 class Dial(displayio.Group):
@@ -63,6 +187,30 @@ class Dial(displayio.Group):
 
     :param int background_color: background color (RGB tuple
      or 24-bit hex value), set `None` for transparent, default is `None`
+    :param str face_cache: directory where the rendered face is stored the first
+     time, and loaded from by later dials with the same configuration instead of
+     drawing it. See :mod:`circuitpython_simple_dial.face_cache`. Defaults to `None`
+    :param bool share_face: Set to True to share the face bitmap and palette with
+     the other dials with the same configuration and colors, so only the first one
+     renders it. The face must not be drawn on afterwards. Call :meth:`deinit` when
+     the dial is discarded. Defaults to `False`
+    :param str tick_style: how the ticks are drawn. ``"rotozoom"`` rotates a tick
+     bitmap with ``bitmaptools.rotozoom``, ``"polygon"`` fills the same rotated
+     rectangle row by row straight into the face. Defaults to ``"rotozoom"``
+    :param label_cache: a :class:`~circuitpython_simple_dial.label_cache.LabelCache`
+     keeping the rendered tick labels, shared with other dials to render each label
+     once. Defaults to `None`
+    :param bool lazy: Set to True to only lay the dial out when it is created, and
+     allocate and draw the face on the first :meth:`render` call. displayio does not
+     tell a group when it is first shown, call :meth:`render` before showing the
+     dial. Defaults to `False`
+    :param bool monochrome: Set to True to draw the ticks, labels and circle with the
+     same palette index, in ``tick_label_color``, so the face bitmap uses 1 bit per
+     pixel. This is automatic when ``tick_color`` and ``tick_label_color`` are the
+     same, the default. The ``dial_palette`` of a 1-bit face has 2 entries, so
+     ``dial_palette[2]`` raises `IndexError`: change the colors with
+     :attr:`tick_color` and :attr:`tick_label_color` instead. See
+     :attr:`face_bytes`. Defaults to `False`
 
     """
 
@@ -92,6 +240,12 @@ class Dial(displayio.Group):
         rotate_tick_labels=True,
         tick_label_scale=1.0,
         background_color=None,
+        face_cache=None,
+        share_face=False,
+        tick_style="rotozoom",
+        label_cache=None,
+        lazy=False,
+        monochrome=False,
         **kwargs,
     ):
         super().__init__(x=x, y=y, scale=1)
@@ -103,6 +257,8 @@ class Dial(displayio.Group):
 
         self._tick_color = tick_color
         self._tick_label_color = tick_label_color
+        self._monochrome = monochrome
+        self._tick_index = self._select_tick_index()
         if tick_label_font is None:
             self._tick_label_font = terminalio_FONT
         else:
@@ -118,12 +274,242 @@ class Dial(displayio.Group):
         self._minor_tick_length = minor_tick_length
 
         self._padding = padding
+        if tick_style not in ("rotozoom", "polygon"):
+            raise ValueError("tick_style must be 'rotozoom' or 'polygon'")
+        self._tick_style = tick_style
+        self._face_cache = face_cache
+        self._share_face = share_face
+        self._shared_face_key = None
+        self._label_cache = label_cache
+        self._lazy = lazy
 
         self._dial_center = None
         self._dial_radius = None
 
+        self.dial_bitmap = None
+        self.dial_palette = None
+        self.dial_tilegrid = None
+        self._render_progress = None
+
+        self._needles = []
+        self._defer_needles = 0
+        self._face_changes = 0
+
         self._initialize_dial(width, height)
 
+    def __enter__(self):
+        self._defer_needles += 1
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self._defer_needles -= 1
+        if not self._defer_needles:
+            self._flush_needles()
+            self._update_face()
+
+    def _flush_needles(self):
+        # compute every pending needle first, then hand all the points over
+        # together, so the display sees one set of changes for the frame
+        moved = []
+        for this_needle in self._needles:
+            if this_needle._pending:
+                this_needle._pending = False
+                if this_needle._prepare_update(this_needle._value):
+                    moved.append(this_needle)
+        for this_needle in moved:
+            this_needle._apply_points()
+
+    def update_needles(self, values):
+        """Set several needle values at once. The needle geometry is computed in
+        one pass and the new points are applied together. Same as setting the
+        values inside a ``with dial:`` block.
+
+        .. code-block:: python
+
+            my_dial.update_needles({needle_hour: 3, needle_min: 25})
+
+            with my_dial:
+                needle_hour.value = 3
+                needle_min.value = 25
+
+        :param dict values: new value for each needle of the dial
+        """
+        with self:
+            for this_needle, value in values.items():
+                this_needle.value = value
+
+    @property
+    def dirty_area(self):
+        """The area changed by the needles since the last :meth:`clear_dirty_area`,
+        as ``(x1, y1, x2, y2)`` in dial coordinates with ``x2`` and ``y2``
+        exclusive, or `None` when no needle moved."""
+        area = None
+        for this_needle in self._needles:
+            needle_area = this_needle.dirty_area
+            if needle_area is None:
+                continue
+            if area is None:
+                area = needle_area
+            else:
+                area = (
+                    min(area[0], needle_area[0]),
+                    min(area[1], needle_area[1]),
+                    max(area[2], needle_area[2]),
+                    max(area[3], needle_area[3]),
+                )
+        return area
+
+    @property
+    def display_dirty_area(self):
+        """Same as :attr:`dirty_area`, offset by the dial ``x`` and ``y``, which are
+        display coordinates when the dial parent group sits at the display origin.
+        A partial refresh driver can push only this window."""
+        area = self.dirty_area
+        if area is None:
+            return None
+        return (area[0] + self.x, area[1] + self.y, area[2] + self.x, area[3] + self.y)
+
+    def clear_dirty_area(self):
+        """Forget the area changed by the needles, usually once per frame after
+        the display was refreshed."""
+        for this_needle in self._needles:
+            this_needle.clear_dirty_area()
+
+    def _invalidate_face(self, changes):
+        # apply the change now, or when the outermost ``with dial:`` block ends
+        self._face_changes |= changes
+        if not self._defer_needles:
+            self._update_face()
+
+    def _update_face(self):
+        changes = self._face_changes
+        if not changes or self.dial_tilegrid is None:
+            return  # a lazy dial draws the new settings when rendered
+        self._face_changes = 0
+
+        tick_index = self._select_tick_index()
+        # copy on write, the other dials keep the shared face, and a new bitmap
+        # when the ticks need an index of their own or no longer do
+        detach = self._shared_face_key is not None or tick_index != self._tick_index
+        if detach:
+            if tick_index != self._tick_index:
+                self._tick_index = tick_index
+                changes |= _FACE_PIXELS
+            if changes & _FACE_PIXELS:
+                if self._shared_face_key is not None:
+                    release_face(self._shared_face_key)
+                    self._shared_face_key = None
+                self.dial_bitmap = displayio.Bitmap(
+                    self._width, self._height, self._tick_index + 1
+                )
+            self.dial_palette = self._make_palette()
+        else:
+            if changes & _FACE_PIXELS:
+                self.dial_bitmap.fill(0)
+            if changes & _FACE_PALETTE:
+                self._set_palette_colors(self.dial_palette)
+
+        if changes & _FACE_PIXELS:
+            # the labels cover parts of the ticks and the circle covers both,
+            # so the layers are drawn again in order in the same bitmap
+            self._font_height = self._get_font_height(
+                font=self._tick_label_font, scale=self._tick_label_scale
+            )
+            for _ in self._draw_face(0):
+                pass
+
+        if detach:
+            tilegrid = displayio.TileGrid(
+                self.dial_bitmap, pixel_shader=self.dial_palette
+            )
+            self[self.index(self.dial_tilegrid)] = tilegrid
+            self.dial_tilegrid = tilegrid
+
+    @property
+    def tick_color(self):
+        """Tick color. Only the palette changes, unless the ticks start or stop
+        sharing the label color, then the face is drawn again at the bitmap depth
+        it needs."""
+        return self._tick_color
+
+    @tick_color.setter
+    def tick_color(self, new_color):
+        self._tick_color = new_color
+        self._invalidate_face(_FACE_PALETTE)
+
+    @property
+    def tick_label_color(self):
+        """Label and circle color. Only the palette changes, unless the ticks start
+        or stop sharing the label color, see :attr:`tick_color`."""
+        return self._tick_label_color
+
+    @tick_label_color.setter
+    def tick_label_color(self, new_color):
+        self._tick_label_color = new_color
+        self._invalidate_face(_FACE_PALETTE)
+
+    @property
+    def background_color(self):
+        """Background color, `None` for transparent. Only the palette changes."""
+        return self._background_color
+
+    @background_color.setter
+    def background_color(self, new_color):
+        self._background_color = new_color
+        self._invalidate_face(_FACE_PALETTE)
+
+    @property
+    def major_ticks(self):
+        """Number of major ticks. The face is drawn again in its bitmap."""
+        return self._major_ticks
+
+    @major_ticks.setter
+    def major_ticks(self, new_count):
+        self._major_ticks = new_count
+        self._invalidate_face(_FACE_PIXELS)
+
+    @property
+    def minor_ticks(self):
+        """Number of minor ticks per major tick. The face is drawn again in its
+        bitmap."""
+        return self._minor_ticks
+
+    @minor_ticks.setter
+    def minor_ticks(self, new_count):
+        self._minor_ticks = new_count
+        self._invalidate_face(_FACE_PIXELS)
+
+    @property
+    def major_tick_labels(self):
+        """Labels of the major ticks. The face is drawn again in its bitmap."""
+        return self._major_tick_labels
+
+    @major_tick_labels.setter
+    def major_tick_labels(self, new_labels):
+        self._major_tick_labels = new_labels
+        self._invalidate_face(_FACE_PIXELS)
+
+    @property
+    def minor_tick_labels(self):
+        """Labels of the minor ticks, `None` for no labels. The face is drawn again
+        in its bitmap."""
+        return self._minor_ticks_labels
+
+    @minor_tick_labels.setter
+    def minor_tick_labels(self, new_labels):
+        self._minor_ticks_labels = new_labels
+        self._invalidate_face(_FACE_PIXELS)
+
+    @property
+    def tick_label_scale(self):
+        """Label scale. The face is drawn again in its bitmap."""
+        return self._tick_label_scale
+
+    @tick_label_scale.setter
+    def tick_label_scale(self, new_scale):
+        self._tick_label_scale = new_scale
+        self._invalidate_face(_FACE_PIXELS)
+
     def _initialize_dial(self, width, height):
 
         # get the tick label font height
@@ -135,71 +521,211 @@ class Dial(displayio.Group):
         self._adjust_dimensions(width, height)
         self._bounding_box = [0, 0, self._width, self._height]
 
-        # create the dial palette and bitmaps
-        self.dial_bitmap = displayio.Bitmap(self._width, self._height, 3)
+        if self._lazy:
+            # the tick angles are all the layout needs until the face is drawn
+            self._set_tick_positions()
+            return
+        self.render()
+
+    @property
+    def is_rendered(self):
+        """`True` once the face bitmap is allocated and drawn"""
+        return self.dial_tilegrid is not None
+
+    def render(self):
+        """Allocate and draw the face of a dial created with ``lazy=True``. Does
+        nothing when the face is already drawn."""
+        if self._render_progress is None:
+            self._render_progress = self.render_steps()
+        for _ in self._render_progress:
+            pass
+        self._render_progress = None
 
-        self.position_major_ticks = self.draw_ticks(
-            tick_count=self._major_ticks,
-            tick_stroke=self._major_tick_stroke,
-            tick_length=self._major_tick_length,
-        )
+    def render_slice(self, budget=0.01):
+        """Draw the face for about ``budget`` seconds, resuming where the previous
+        call stopped, so a main loop can build a ``lazy`` dial between its other
+        work. Returns `True` once the face is drawn.
+
+        :param float budget: time to spend drawing, in seconds. The step running when
+         it runs out is finished. Defaults to :const:`0.01`
+        """
+        if self._render_progress is None:
+            self._render_progress = self.render_steps()
+        # integer ticks, only the elapsed time becomes a float
+        start = ticks()
+        budget *= TICKS_PER_SECOND
+        for _ in self._render_progress:
+            if ticks() - start >= budget:
+                return False
+        self._render_progress = None
+        return True
+
+    def render_steps(self, tick_batch=8):
+        """Generator drawing the face one piece at a time: it yields after each
+        batch of ticks and each label, and the circle is the last step. The face
+        is shown once the generator is exhausted. Use :meth:`render_slice` to
+        spend a time budget on it, or drive it from an asyncio task:
+
+        .. code-block:: python
+
+            for _ in my_dial.render_steps():
+                await asyncio.sleep(0)
+
+        :param int tick_batch: number of ticks drawn between two steps.
+         Defaults to :const:`8`
+        """
+        if self.dial_tilegrid is not None:
+            return
+        # settings changed before the first render only marked the face, the
+        # depth, the label height and the face key must follow them
+        if self._face_changes & _FACE_PIXELS:
+            self._font_height = self._get_font_height(
+                font=self._tick_label_font, scale=self._tick_label_scale
+            )
+        self._tick_index = self._select_tick_index()
+        self._face_changes = 0
+
+        shared_face = None
+        if self._share_face:
+            self._shared_face_key = (
+                face_key(self),
+                self._background_color,
+                self._tick_label_color,
+                self._tick_color,
+            )
+            shared_face = acquire_face(self._shared_face_key)
 
-        temporal_position_minor_ticks = self.draw_ticks(
-            tick_count=self._minor_ticks * (self._major_ticks - 1) + 1,
-            tick_stroke=self._minor_tick_stroke,
-            tick_length=self._minor_tick_length,
+        if shared_face is None:
+            yield from self._create_face(tick_batch)
+            if self._share_face:
+                _register_face(
+                    self._shared_face_key,
+                    self.dial_bitmap,
+                    self.dial_palette,
+                    self.position_major_ticks,
+                    self.position_minor_ticks,
+                )
+        else:
+            # an identical dial already rendered this face, only a TileGrid is needed
+            self.dial_bitmap = shared_face.bitmap
+            self.dial_palette = shared_face.palette
+            self.position_major_ticks = shared_face.position_major_ticks
+            self.position_minor_ticks = shared_face.position_minor_ticks
+
+        # create the dial tilegrid and add it to the self Widget->Group, below
+        # the needles added before the face was rendered
+        self.dial_tilegrid = displayio.TileGrid(
+            self.dial_bitmap, pixel_shader=self.dial_palette
         )
-        self.position_minor_ticks = []
-        for element in temporal_position_minor_ticks:
-            if element not in self.position_major_ticks:
-                self.position_minor_ticks.append(element)
+        self.insert(0, self.dial_tilegrid)
 
-        self.draw_labels(self.position_major_ticks, self._major_tick_labels)
-        if self._minor_ticks_labels:
-            self.draw_labels(self.position_minor_ticks, self._minor_ticks_labels)
+    def _create_face(self, tick_batch):
+        # create the dial palette and bitmaps
+        self.dial_bitmap = displayio.Bitmap(
+            self._width, self._height, self._tick_index + 1
+        )
 
-        self.dial_palette = displayio.Palette(4)
+        if self._face_cache is None:
+            yield from self._draw_face(tick_batch)
+        else:
+            cache_path = face_path(self._face_cache, self)
+            if load_face(cache_path, self.dial_bitmap):
+                self._set_tick_positions()
+            else:
+                yield from self._draw_face(tick_batch)
+                save_face(cache_path, self.dial_bitmap)
+
+        self.dial_palette = self._make_palette()
+
+    def _select_tick_index(self):
+        # the ticks share index 1 with the labels and the circle when they look
+        # the same, then the face bitmap needs a single bit per pixel
+        if self._monochrome or self._tick_color == self._tick_label_color:
+            return 1
+        return 2
+
+    @property
+    def face_bytes(self):
+        """Bytes of pixel data in the face bitmap, 1 bit per pixel when the ticks
+        share the label color or in ``monochrome`` mode, 2 bits otherwise"""
+        bits = 1 if self._tick_index == 1 else 2
+        return (self._width * self._height * bits + 7) // 8
+
+    def _make_palette(self):
+        # no index 2 on 1-bit faces, older code setting dial_palette[2] must use
+        # the tick_color setter
+        palette = displayio.Palette(2 if self._tick_index == 1 else 4)
+        self._set_palette_colors(palette)
+        return palette
+
+    def _set_palette_colors(self, palette):
         if self._background_color is None:
-            self.dial_palette.make_transparent(0)
-            self.dial_palette[0] = 0x000000
+            palette.make_transparent(0)
+            palette[0] = 0x000000
         else:
-            self.dial_palette[0] = self._background_color
-        self.dial_palette[1] = self._tick_label_color
-        self.dial_palette[2] = self._tick_color
+            palette.make_opaque(0)
+            palette[0] = self._background_color
+        palette[1] = self._tick_label_color
+        if self._tick_index == 2:
+            palette[2] = self._tick_color
+
+    def deinit(self):
+        """Release the face shared with other dials, see ``share_face``. The
+        registry frees it once no dial uses it anymore. The dial must not be
+        shown after this."""
+        if self._shared_face_key is not None:
+            release_face(self._shared_face_key)
+            self._shared_face_key = None
+
+    def _set_tick_positions(self):
+        # the tick angles, without drawing anything
+        self.position_major_ticks = self._tick_angles(self._major_ticks)
+        self.position_minor_ticks = self._tick_angles(
+            self._minor_ticks * (self._major_ticks - 1) + 1, skip=self._minor_ticks
+        )
 
-        # create the dial tilegrid and append to the self Widget->Group
-        self.dial_tilegrid = displayio.TileGrid(
-            self.dial_bitmap, pixel_shader=self.dial_palette
+    def _draw_face(self, tick_batch):
+        self._set_tick_positions()
+
+        yield from self._tick_steps(
+            self.position_major_ticks,
+            self._major_tick_stroke,
+            self._major_tick_length,
+            tick_batch,
+        )
+        # every minor_ticks-th minor tick lies under a major tick, it is skipped
+        yield from self._tick_steps(
+            self.position_minor_ticks,
+            self._minor_tick_stroke,
+            self._minor_tick_length,
+            tick_batch,
         )
-        self.append(self.dial_tilegrid)
+
+        yield from self._label_steps(self.position_major_ticks, self._major_tick_labels)
+        if self._minor_ticks_labels:
+            yield from self._label_steps(
+                self.position_minor_ticks, self._minor_ticks_labels
+            )
 
         self._draw_circle()
-        # For CP version 8.1
-        # bitmaptools.draw_circle(self.dial_bitmap, self._dial_center[0],
-        # self._dial_center[1], self._dial_radius, 1)
 
     def _draw_circle(self):
-
-        x = 0
-        y = self._dial_radius
-        d = 3 - 2 * self._dial_radius
-
-        while x <= y:
-            self.dial_bitmap[x + self._dial_center[0], y + self._dial_center[1]] = 1
-            self.dial_bitmap[-x + self._dial_center[0], -y + self._dial_center[1]] = 1
-            self.dial_bitmap[x + self._dial_center[0], -y + self._dial_center[1]] = 1
-            self.dial_bitmap[-x + self._dial_center[0], y + self._dial_center[1]] = 1
-            self.dial_bitmap[y + self._dial_center[0], x + self._dial_center[1]] = 1
-            self.dial_bitmap[-y + self._dial_center[0], x + self._dial_center[1]] = 1
-            self.dial_bitmap[-y + self._dial_center[0], -x + self._dial_center[1]] = 1
-            self.dial_bitmap[y + self._dial_center[0], -x + self._dial_center[1]] = 1
-
-            if d <= 0:
-                d = d + (4 * x) + 6
-            else:
-                d = d + 4 * (x - y) + 10
-                y = y - 1
-            x = x + 1
+        if hasattr(bitmaptools, "draw_circle"):  # CircuitPython 8.1 and later
+            bitmaptools.draw_circle(
+                self.dial_bitmap,
+                self._dial_center[0],
+                self._dial_center[1],
+                self._dial_radius,
+                1,
+            )
+        else:
+            _draw_circle_spans(
+                self.dial_bitmap,
+                self._dial_center[0],
+                self._dial_center[1],
+                self._dial_radius,
+                1,
+            )
 
     def _adjust_dimensions(self, width, height):
 
@@ -226,61 +752,104 @@ class Dial(displayio.Group):
                 font_height = int(scale * font.ascent + font.ascent)
         return font_height
 
-    def draw_ticks(self, tick_count, tick_stroke, tick_length):
+    @staticmethod
+    def _tick_angles(tick_count, skip=None):
+        # angles of the ticks, in radians, starting at the bottom of the dial,
+        # leaving out the indices that are multiples of skip
+        angle_positions = []
+        if tick_count > 1:
+            for i in range(tick_count):
+                if skip and not i % skip:
+                    continue
+                angle_positions.append(
+                    round(
+                        (-180 + ((i * 360 / (tick_count - 1)))) * (2 * math.pi / 360),
+                        4,
+                    )
+                )
+        return angle_positions
+
+    def draw_ticks(self, tick_count, tick_stroke, tick_length, skip=None):
         """Helper function for drawing ticks on the dial widget.  Can be used to
         customize the dial face.
 
         :param int tick_count: number of ticks to be drawn
         :param int tick_stroke: the pixel width of the line used to draw the tick
+        :param int tick_length: the tick length, in pixels
+        :param int skip: leave out the ticks whose index is a multiple of ``skip``,
+         e.g. the ones that fall under the major ticks. Defaults to `None`
 
         """
-        angle_positions = []
-        if tick_count <= 1:
+        angle_positions = self._tick_angles(tick_count, skip)
+        for _ in self._tick_steps(angle_positions, tick_stroke, tick_length):
             pass
-        else:
-            tick_bitmap = displayio.Bitmap(
-                tick_stroke, tick_length, 3
-            )  # make a tick line bitmap for blitting
-            tick_bitmap.fill(2)
-            for i in range(tick_count):
-                this_angle = round(
-                    (-180 + ((i * 360 / (tick_count - 1)))) * (2 * math.pi / 360),
-                    4,
-                )  # in radians
-                angle_positions.append(this_angle)
-                target_position_x = self._dial_center[0] + self._dial_radius * math.sin(
-                    this_angle
-                )
-                target_position_y = self._dial_center[1] - self._dial_radius * math.cos(
-                    this_angle
-                )
+        return angle_positions
 
-                bitmaptools.rotozoom(
+    def _tick_steps(self, angle_positions, tick_stroke, tick_length, tick_batch=0):
+        # draw the ticks at angle_positions, yielding after every tick_batch ticks
+        if not angle_positions:
+            return
+        if self._tick_style == "polygon":
+            for i, this_angle in enumerate(angle_positions):
+                if tick_batch and i and not i % tick_batch:
+                    yield
+                fill_rotated_rect(
                     self.dial_bitmap,
-                    ox=round(target_position_x),
-                    oy=round(target_position_y),
-                    source_bitmap=tick_bitmap,
-                    px=round(tick_bitmap.width / 2),
-                    py=0,
-                    angle=this_angle,  # in radians
+                    round(
+                        self._dial_center[0] + self._dial_radius * math.sin(this_angle)
+                    ),
+                    round(
+                        self._dial_center[1] - self._dial_radius * math.cos(this_angle)
+                    ),
+                    round(tick_stroke / 2),
+                    tick_stroke,
+                    tick_length,
+                    this_angle,
+                    self._tick_index,
                 )
-        return angle_positions
+            yield
+            return
+
+        tick_bitmap = displayio.Bitmap(
+            tick_stroke, tick_length, self._tick_index + 1
+        )  # make a tick line bitmap for blitting
+        tick_bitmap.fill(self._tick_index)
+        for i, this_angle in enumerate(angle_positions):
+            if tick_batch and i and not i % tick_batch:
+                yield
+            target_position_x = self._dial_center[0] + self._dial_radius * math.sin(
+                this_angle
+            )
+            target_position_y = self._dial_center[1] - self._dial_radius * math.cos(
+                this_angle
+            )
+
+            bitmaptools.rotozoom(
+                self.dial_bitmap,
+                ox=round(target_position_x),
+                oy=round(target_position_y),
+                source_bitmap=tick_bitmap,
+                px=round(tick_bitmap.width / 2),
+                py=0,
+                angle=this_angle,  # in radians
+            )
+        yield
 
     def draw_labels(self, positions, labels):
         """Helper function for drawing text labels on the dial widget.  Can be used
         to customize the dial face.
 
         """
+        for _ in self._label_steps(positions, labels):
+            pass
 
+    def _label_steps(self, positions, labels):
+        # draw the labels at positions, yielding after each one
         label_count = len(positions)
 
         for i, this_label_text in enumerate(labels):
             if i >= label_count:
                 break
-            temp_label = bitmap_label.Label(
-                self._tick_label_font, text=this_label_text
-            )  # make a tick line bitmap for blitting
-
             this_angle = positions[i]
 
             target_position_x = self._dial_center[0] + (
@@ -293,13 +862,29 @@ class Dial(displayio.Group):
             if not self._rotate_tick_labels:
                 this_angle = 0
 
-            bitmaptools.rotozoom(
-                self.dial_bitmap,
-                ox=round(target_position_x),
-                oy=round(target_position_y),
-                source_bitmap=temp_label.bitmap,
-                px=round(temp_label.bitmap.width // 2),
-                py=round(temp_label.bitmap.height // 2),
-                angle=this_angle,
-                scale=self._tick_label_scale,
-            )
+            if self._label_cache is not None:
+                self._label_cache.draw(
+                    self.dial_bitmap,
+                    self._tick_label_font,
+                    this_label_text,
+                    round(target_position_x),
+                    round(target_position_y),
+                    this_angle,
+                    self._tick_label_scale,
+                )
+            else:
+                temp_label = bitmap_label.Label(
+                    self._tick_label_font, text=this_label_text
+                )  # make a tick line bitmap for blitting
+
+                bitmaptools.rotozoom(
+                    self.dial_bitmap,
+                    ox=round(target_position_x),
+                    oy=round(target_position_y),
+                    source_bitmap=temp_label.bitmap,
+                    px=round(temp_label.bitmap.width // 2),
+                    py=round(temp_label.bitmap.height // 2),
+                    angle=this_angle,
+                    scale=self._tick_label_scale,
+                )
+            yield
@@ -0,0 +1,283 @@
+# SPDX-FileCopyrightText: 2023 Jose David Montoya
+#
+# SPDX-License-Identifier: MIT
+"""
+
+`sprite_needle`
+================================================================================
+Dial needle drawn from pre-rendered frames instead of a ``vectorio.Polygon``,
+for ports where filling the polygon on every refresh is slow.
+
+* Author(s): Jose David Montoya
+
+Implementation Notes
+--------------------
+
+The needle is drawn once for each angle of the first quarter turn into a 1-bit
+sprite sheet, one tile per angle, and the other three quarters are the same
+tiles mirrored with the ``TileGrid`` ``flip_x`` and ``flip_y``. A tile only
+covers the quarter of the dial the needle points to, or the whole dial for a
+``needle_full`` needle. Moving the needle changes the tile index, the flips
+and the position of the ``TileGrid``, whatever the needle size.
+
+The number of frames, angles around the whole dial, is a multiple of four. It
+is given, taken from the needle ``value_step`` when those frames fit in
+``memory_budget``, or the most whose tiles fit. The needle angle is rounded to
+the nearest frame.
+
+The frames fill the exact needle rectangle, like the ``"polygon"`` dial ticks.
+The ``vectorio`` needle rounds its corners to whole pixels first, so each of
+its sides can move by half a pixel. At the axis-aligned angles an odd width
+moves both sides out: a width 3 needle is 4 pixels wide there, 392 pixels on
+a 240 pixel dial against 294 for the sprite. At other angles the sprite can be
+the wider one.
+
+"""
+
+import math
+import displayio
+from circuitpython_simple_dial.simple_dial import fill_rotated_rect
+from circuitpython_simple_dial.dial_needle import NeedleBase
+
+# pylint: disable=too-many-instance-attributes, too-many-arguments, invalid-name
+# pylint: disable=unused-argument, too-many-locals, protected-access
+
+_TWO_PI = 2 * math.pi
+
+
+def _bitmap_bytes(width, height):
+    # 1-bit displayio bitmaps store each row in whole 32-bit words
+    return (width + 31) // 32 * 4 * height
+
+
+def _frame_quarter(frames, value_step, value_range, tile_bytes, memory_budget, radius):
+    # number of tiles per quarter turn, without the last one at 90 degrees
+    if frames is not None:
+        return math.ceil(frames / 4)
+    # one tile per angle from 0 to 90 degrees, both included
+    budget_quarter = memory_budget // tile_bytes - 1
+    if value_step is not None:
+        # a multiple of the step count, so every step has its own frame
+        steps = round(value_range / value_step)
+        if not steps % 4:
+            quarter = steps // 4
+        elif not steps % 2:
+            quarter = steps // 2
+        else:
+            quarter = steps
+        if quarter <= budget_quarter:
+            return quarter
+    # more frames than pixels around the needle tip look the same
+    return min(budget_quarter, math.ceil(_TWO_PI * radius / 4))
+
+
+def _draw_sheet(quarter, tile_size, reach, back, needle_width, needle_length, length):
+    # the needle at each angle of the first quarter turn, one tile below the other
+    sheet = displayio.Bitmap(tile_size, tile_size * (quarter + 1), 2)
+    for tile in range(quarter + 1):
+        angle = math.pi / 2 * tile / quarter
+        # the needle tip, the rectangle runs from there towards the center
+        fill_rotated_rect(
+            sheet,
+            back + needle_length * math.sin(angle),
+            tile * tile_size + reach - needle_length * math.cos(angle),
+            needle_width / 2,
+            needle_width,
+            length,
+            angle,
+            1,
+        )
+    return sheet
+
+
+class sprite_needle(NeedleBase):
+    """
+    Class sprite_needle, with the parameters and ``value`` of
+    :class:`~circuitpython_simple_dial.dial_needle.needle`. Its ``dirty_area`` is
+    the whole square the frames cover, whatever the frame.
+
+    :param dial_object: dial object for the needle to be drawn on
+    :param int needle_width: needle width. Default to :const:`3`
+    :param int needle_pad: space between the dial circle and the needle. Defaults to :const:`10`
+    :param bool needle_full: Set to True to show a full needle. Defaults to `False`
+    :param int needle_color: color value for the needle. Defaults to :const:`0x880000`
+    :param bool limit_rotation: Set True to limit needle rotation to between the
+     ``min_value`` and ``max_value``, set to `False` for unlimited rotation. Defaults to `True`
+    :param float value: the value to display (if None, defaults to ``min_value``)
+    :param float min_value: the minimum value displayed on the dial. Defaults to :const:`0.0`
+    :param float max_value: the maximum value displayed the dial. Defaults to :const:`100.0`
+    :param bool trig_table: accepted for compatibility with ``needle``, the frames
+     are computed once. Defaults to `False`
+    :param bool fixed_point: accepted for compatibility with ``needle``, like
+     ``trig_table``. Defaults to `False`
+    :param float value_step: Set to give every step a frame of its own, e.g. :const:`1`
+     for the hours of a clock, so every step is drawn at its exact angle. When those
+     frames do not fit in ``memory_budget``, the needle gets as many as fit and the
+     steps are rounded to the nearest frame. Defaults to `None`
+    :param int frames: number of needle angles around the dial, rounded up to a
+     multiple of four. Takes precedence over ``value_step`` and ``memory_budget``.
+     Defaults to `None`
+    :param int memory_budget: most bytes for the sprite sheet when the number of
+     frames is not given, also with a ``value_step``. Defaults to :const:`16384`
+
+    .. code-block:: python
+
+        my_needle = sprite_needle(my_dial, needle_width=4, memory_budget=8192)
+        print(my_needle.frames, my_needle.sheet_bytes)
+        my_needle.value = 42
+
+    """
+
+    def __init__(
+        self,
+        dial_object,
+        needle_width=3,
+        needle_pad=10,
+        needle_full=False,
+        needle_color=0x880000,
+        limit_rotation=True,
+        value=None,
+        min_value=0.0,
+        max_value=100.0,
+        trig_table=False,
+        value_step=None,
+        frames=None,
+        memory_budget=16384,
+        fixed_point=False,
+    ):
+        if max_value == min_value:
+            raise ValueError("min_value and max_value must be different")
+        if value is None:
+            value = min_value
+        super().__init__(dial_object, value)
+        self._min_value = min_value
+        self._max_value = max_value
+        self._limit_rotation = limit_rotation
+        self._value_scale = 1 / (max_value - min_value)
+        self._value_offset = -min_value * self._value_scale
+
+        needle_length = dial_object._dial_radius - needle_pad
+        # the tile spans from the dial center to the needle reach towards the
+        # top right, plus the needle width on the other sides, or the whole
+        # dial for a full needle
+        reach = needle_length + math.ceil(needle_width / 2) + 2
+        if needle_full:
+            back = reach
+        else:
+            back = math.ceil(needle_width / 2) + 2
+        tile_size = reach + back + 1
+        self._tile_bytes = _bitmap_bytes(tile_size, tile_size)
+
+        quarter = _frame_quarter(
+            frames,
+            value_step,
+            abs(max_value - min_value),
+            self._tile_bytes,
+            memory_budget,
+            needle_length,
+        )
+        if quarter < 1:
+            raise ValueError(
+                "memory_budget too small, a tile takes %d bytes" % self._tile_bytes
+            )
+        self._quarter = quarter
+
+        self._needle_palette = displayio.Palette(2)
+        self._needle_palette.make_transparent(0)
+        self._needle_palette[1] = needle_color
+
+        sheet = _draw_sheet(
+            quarter,
+            tile_size,
+            reach,
+            back,
+            needle_width,
+            needle_length,
+            2 * needle_length if needle_full else needle_length,
+        )
+
+        center_x, center_y = dial_object._dial_center
+        # tile position, unflipped and flipped
+        self._tile_x = (center_x - back, center_x - reach)
+        self._tile_y = (center_y - reach, center_y - back)
+
+        self._frame = None
+        # the frames together cover the square around the dial center, every
+        # move dirties all of it
+        self._dirty = (
+            center_x - reach,
+            center_y - reach,
+            center_x + reach + 1,
+            center_y + reach + 1,
+        )
+
+        self._needle = displayio.TileGrid(
+            sheet,
+            pixel_shader=self._needle_palette,
+            tile_width=tile_size,
+            tile_height=tile_size,
+            x=self._tile_x[0],
+            y=self._tile_y[0],
+        )
+        self._update_needle(self._value)
+        dial_object.append(self._needle)
+        dial_object._needles.append(self)
+
+    def _prepare_update(self, value):
+        # Select the frame for ``value``; returns False, and counts a
+        # skipped update, when it is already shown.
+        position = value * self._value_scale + self._value_offset
+        if self._limit_rotation:
+            if position < 0.0:
+                position = 0.0
+            elif position > 1.0:
+                position = 1.0
+        frames = 4 * self._quarter
+        frame = round(position * frames) % frames
+        if frame == self._frame:
+            self._skipped_updates += 1
+            return False
+        self._frame = frame
+        return True
+
+    def _apply_points(self):
+        # frames count from the bottom of the dial, turn them into a tile of
+        # the first quarter turn from the top, and the flips that map it there
+        quarter = self._quarter
+        turn = (self._frame - 2 * quarter) % (4 * quarter)
+        if turn < quarter:
+            tile, flip_x, flip_y = turn, False, False
+        elif turn < 2 * quarter:
+            tile, flip_x, flip_y = 2 * quarter - turn, False, True
+        elif turn < 3 * quarter:
+            tile, flip_x, flip_y = turn - 2 * quarter, True, True
+        else:
+            tile, flip_x, flip_y = 4 * quarter - turn, True, False
+        needle_tilegrid = self._needle
+        needle_tilegrid[0] = tile
+        needle_tilegrid.flip_x = flip_x
+        needle_tilegrid.flip_y = flip_y
+        needle_tilegrid.x = self._tile_x[flip_x]
+        needle_tilegrid.y = self._tile_y[flip_y]
+        self._applied_updates += 1
+        self._is_dirty = True
+
+    @property
+    def min_value(self):
+        """The minimum value displayed on the dial."""
+        return self._min_value
+
+    @property
+    def max_value(self):
+        """The maximum value displayed on the dial."""
+        return self._max_value
+
+    @property
+    def frames(self):
+        """Number of needle angles around the dial"""
+        return 4 * self._quarter
+
+    @property
+    def sheet_bytes(self):
+        """Bytes of pixel data in the sprite sheet"""
+        return (self._quarter + 1) * self._tile_bytes
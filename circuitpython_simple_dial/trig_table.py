@@ -0,0 +1,266 @@
+# SPDX-FileCopyrightText: 2023 Jose David Montoya
+#
+# SPDX-License-Identifier: MIT
+"""
+
+`trig_table`
+================================================================================
+Quantized sine/cosine lookup table for the needle angles, shared by every
+needle in the process.
+
+* Author(s): Jose David Montoya
+
+Implementation Notes
+--------------------
+
+The table divides a full turn in ``size`` steps, with ``size`` chosen from the
+dial pixel circumference, one step per pixel by default. Only a quarter wave is
+stored, so a 120 pixel radius dial uses about 760 bytes. The angle is rounded
+to the nearest step and moved to the exact angle with the terms up to the
+second order, ``sin(a + d) = sin(a) + d * cos(a) - d * d / 2 * sin(a)``, so a
+point ``r`` pixels away from the center is at most
+``r * ((pi / size) ** 3 / 6 + 2 ** -22)`` pixels from the exact position, see
+:meth:`TrigTable.max_error`. That is 1/30000 of a pixel at the circle of that
+dial. The needle rounds its corners with ``math.sin`` and ``math.cos`` instead
+when one lands closer than that to a half pixel, so the pixels always match the
+``math`` path.
+
+The table is not faster everywhere: on CPython, where ``math.sin`` is a single
+C call, a needle update with the table runs at about two thirds of the speed of
+the ``math`` path. It can only pay off where ``math.sin`` and ``math.cos`` cost
+more than the multiplications of the correction, so measure it with
+``benchmarks/dial_benchmark.py`` on the board before turning it on.
+
+The table can also hold the sine as integers scaled by ``2 ** FIXED_BITS``,
+from the same single precision values, for the needle fixed-point path meant
+for boards without a floating point unit, see :data:`SOFT_FLOAT`. That path
+takes the angle as an integer and moves the step to it with the same terms in
+integers, which adds at most ``3 * 2 ** -FIXED_BITS`` per pixel of radius, see
+:meth:`TrigTable.max_fixed_error`, and falls back to ``math`` the same way. It
+is slower than ``math`` on CPython too and has not been measured on a board,
+so the needles only use it when asked to.
+
+"""
+
+import math
+from array import array
+
+FIXED_BITS = 18
+"""Fraction bits of the fixed-point sine values"""
+
+_FIXED_ONE = 1 << FIXED_BITS
+_FIXED_HALF = 1 << (FIXED_BITS - 1)
+
+# chips whose cores have no floating point unit, as named in os.uname().machine
+_SOFT_FLOAT_CHIPS = ("samd21", "rp2040", "esp32s2", "esp32c3", "esp32c6", "esp32h2")
+
+
+def _soft_float():
+    try:
+        import os  # pylint: disable=import-outside-toplevel
+
+        machine = os.uname().machine.lower()
+    except (ImportError, AttributeError):
+        return False
+    for chip in _SOFT_FLOAT_CHIPS:
+        if chip in machine:
+            return True
+    return False
+
+
+SOFT_FLOAT = _soft_float()
+"""`True` on boards whose floats are computed in software, where the needle
+fixed-point path is worth measuring"""
+
+_tables = {}
+
+
+class TrigTable:
+    """Quarter-wave sine table dividing a turn in ``size`` steps
+
+    :param int size: number of steps per turn, a multiple of 4
+    """
+
+    def __init__(self, size):
+        if size < 4 or size % 4:
+            raise ValueError("size must be a positive multiple of 4")
+        self.size = size
+        self.step_angle = 2 * math.pi / size
+        """Angle of one table step, in radians"""
+        self._quarter = size // 4
+        self._sin = array(
+            "f", [math.sin(2 * math.pi * i / size) for i in range(self._quarter + 1)]
+        )
+        self._fixed_sin = None
+        self.fixed_turn = size << FIXED_BITS
+        """A full turn in the ``2 ** -FIXED_BITS`` table steps of
+        :meth:`corrected_fixed_sin_cos`"""
+        self._fixed_step_angle = round(self.step_angle * _FIXED_ONE)
+
+    def _sin_index(self, index, values):
+        quarter = self._quarter
+        index %= self.size
+        quadrant = index // quarter
+        offset = index - quadrant * quarter
+        if quadrant == 0:
+            return values[offset]
+        if quadrant == 1:
+            return values[quarter - offset]
+        if quadrant == 2:
+            return -values[offset]
+        return -values[quarter - offset]
+
+    def step(self, turns):
+        """Table step nearest to the angle ``2 * pi * turns``
+
+        :param float turns: angle as a fraction of a full turn, any value
+        """
+        return round(turns * self.size)
+
+    def delta(self, turns, step):
+        """Angle in radians from table step ``step`` to the angle ``2 * pi * turns``,
+        at most half a step
+
+        :param float turns: the angle given to :meth:`step`
+        :param int step: the table step returned by :meth:`step`
+        """
+        return (turns * self.size - step) * self.step_angle
+
+    def sin_step(self, step):
+        """Sine of table step ``step``, as returned by :meth:`step`"""
+        return self._sin_index(step, self._sin)
+
+    def cos_step(self, step):
+        """Cosine of table step ``step``, as returned by :meth:`step`"""
+        return self._sin_index(step + self._quarter, self._sin)
+
+    def corrected_sin_cos(self, turns, values):
+        """Write the sine and cosine of the angle ``2 * pi * turns`` in ``values[0]``
+        and ``values[1]``: the values of the nearest step moved to the angle with
+        the second order terms, see :meth:`max_error`. Does in one call what
+        :meth:`step`, :meth:`delta`, :meth:`sin_step` and :meth:`cos_step` do.
+
+        :param float turns: angle as a fraction of a full turn, any value
+        :param list values: a list of at least two items, reused between calls
+        """
+        scaled = turns * self.size
+        step = round(scaled)
+        delta = (scaled - step) * self.step_angle
+        half_square = delta * delta / 2
+        table = self._sin
+        quarter = self._quarter
+        index = step % self.size
+        quadrant = index // quarter
+        offset = index - quadrant * quarter
+        if quadrant == 0:
+            sin_step = table[offset]
+            cos_step = table[quarter - offset]
+        elif quadrant == 1:
+            sin_step = table[quarter - offset]
+            cos_step = -table[offset]
+        elif quadrant == 2:
+            sin_step = -table[offset]
+            cos_step = -table[quarter - offset]
+        else:
+            sin_step = -table[quarter - offset]
+            cos_step = table[offset]
+        values[0] = sin_step + delta * cos_step - half_square * sin_step
+        values[1] = cos_step - delta * sin_step - half_square * cos_step
+
+    def add_fixed(self):
+        """Store the sine values as integers too, for
+        :meth:`corrected_fixed_sin_cos`. Does nothing when they are already stored."""
+        if self._fixed_sin is None:
+            self._fixed_sin = array(
+                "i", [round(value * _FIXED_ONE) for value in self._sin]
+            )
+
+    def corrected_fixed_sin_cos(self, units, values):
+        """:meth:`corrected_sin_cos` with integers only: write the sine and cosine
+        of the angle ``2 * pi * units / fixed_turn``, times ``2 ** FIXED_BITS``, in
+        ``values[0]`` and ``values[1]``. Needs :meth:`add_fixed`.
+
+        :param int units: angle in ``2 ** -FIXED_BITS`` table steps, any value
+        :param list values: a list of at least two items, reused between calls
+        """
+        step = (units + _FIXED_HALF) >> FIXED_BITS
+        delta = (
+            (units - (step << FIXED_BITS)) * self._fixed_step_angle + _FIXED_HALF
+        ) >> FIXED_BITS
+        half_square = (delta * delta + _FIXED_ONE) >> (FIXED_BITS + 1)
+        table = self._fixed_sin
+        quarter = self._quarter
+        index = step % self.size
+        quadrant = index // quarter
+        offset = index - quadrant * quarter
+        if quadrant == 0:
+            sin_step = table[offset]
+            cos_step = table[quarter - offset]
+        elif quadrant == 1:
+            sin_step = table[quarter - offset]
+            cos_step = -table[offset]
+        elif quadrant == 2:
+            sin_step = -table[offset]
+            cos_step = -table[quarter - offset]
+        else:
+            sin_step = -table[quarter - offset]
+            cos_step = table[offset]
+        values[0] = sin_step + (
+            (delta * cos_step - half_square * sin_step + _FIXED_HALF) >> FIXED_BITS
+        )
+        values[1] = cos_step - (
+            (delta * sin_step + half_square * cos_step + _FIXED_HALF) >> FIXED_BITS
+        )
+
+    def sin_cos(self, turns):
+        """Sine and cosine of the angle ``2 * pi * turns``, rounded to the nearest step
+
+        :param float turns: angle as a fraction of a full turn, any value
+        """
+        step = round(turns * self.size)
+        return self._sin_index(step, self._sin), self._sin_index(
+            step + self._quarter, self._sin
+        )
+
+    def max_error(self, radius):
+        """Largest distance, in pixels, between the exact position of a point
+        ``radius`` pixels away from the dial center and the position from the
+        table values moved by :meth:`delta` with the second order terms,
+        including the rounding of the single precision values
+
+        :param float radius: distance from the center, in pixels
+        """
+        return radius * (self.step_angle**3 / 48 + 2**-22)
+
+    def max_fixed_error(self, radius):
+        """:meth:`max_error` for :meth:`corrected_fixed_sin_cos`. The rounding of
+        the values, of the angle of a step and of the three shifts, half a unit
+        each or less, add up to less than ``3 * 2 ** -FIXED_BITS`` per pixel of
+        radius
+
+        :param float radius: distance from the center, in pixels
+        """
+        return self.max_error(radius) + radius * 3 * 2**-FIXED_BITS
+
+    @property
+    def nbytes(self):
+        """Bytes used by the table values"""
+        if self._fixed_sin is None:
+            return len(self._sin) * self._sin.itemsize
+        return len(self._sin) * (self._sin.itemsize + self._fixed_sin.itemsize)
+
+
+def get_table(radius, oversample=1):
+    """Return the shared table for a dial of ``radius`` pixels, creating it
+    on first use. Dials of the same size share the same table.
+
+    :param int radius: dial radius, in pixels
+    :param int oversample: steps per pixel of circumference. Defaults to :const:`1`
+    """
+    size = math.ceil(2 * math.pi * radius * oversample)
+    size += -size % 4
+    table = _tables.get(size)
+    if table is None:
+        table = TrigTable(size)
+        _tables[size] = table
+    return table
@@ -0,0 +1,40 @@
+# SPDX-FileCopyrightText: 2023 Jose David Montoya
+#
+# SPDX-License-Identifier: MIT
+
+import time
+import board
+import displayio
+import terminalio
+from circuitpython_simple_dial.simple_dial import Dial
+from circuitpython_simple_dial.dial_needle import needle
+from circuitpython_simple_dial.needle_animation import NeedleAnimator, ease_out_cubic
+
+
+display = board.DISPLAY
+display.auto_refresh = False
+
+# Create a Dial widget
+my_dial = Dial(
+    x=100,  # set x-position
+    y=120,  # set y-position
+    width=150,  # requested width of the dial
+    height=150,  # requested height of the dial
+    padding=12,  # add 12 pixels around the dial to make room for labels
+    tick_label_font=terminalio.FONT,  # the font used for the tick labels
+)
+
+my_needle = needle(my_dial)
+animator = NeedleAnimator(my_needle, frame_rate=20, easing=ease_out_cubic)
+
+my_group = displayio.Group()
+my_group.append(my_dial)
+
+display.show(my_group)  # add high level Group to the display
+
+for target in (80, 20, 100, 0):
+    animator.animate_to(target, duration=1.5)
+    while animator.animating:
+        if animator.update():
+            display.refresh()  # only refresh when the needle moved
+    time.sleep(0.5)
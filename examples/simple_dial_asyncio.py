@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: 2023 Jose David Montoya
+#
+# SPDX-License-Identifier: MIT
+
+import random
+import asyncio
+import board
+import displayio
+import terminalio
+from circuitpython_simple_dial.simple_dial import Dial
+from circuitpython_simple_dial.dial_needle import needle
+from circuitpython_simple_dial.dial_asyncio import DialCoordinator
+
+
+display = board.DISPLAY
+display.auto_refresh = False
+
+# Create a Dial widget
+my_dial = Dial(
+    x=40,  # set x-position
+    y=40,  # set y-position
+    width=150,  # requested width of the dial
+    height=150,  # requested height of the dial
+    padding=12,  # add 12 pixels around the dial to make room for labels
+    tick_label_font=terminalio.FONT,  # the font used for the tick labels
+)
+
+my_needle = needle(my_dial, value=30)
+my_needle2 = needle(my_dial, value=60, needle_color=0x0088FF)
+
+my_group = displayio.Group()
+my_group.append(my_dial)
+
+display.show(my_group)  # add high level Group to the display
+
+coordinator = DialCoordinator([my_dial], display, frame_rate=20, duration=0.5)
+
+
+async def read_sensor(this_needle, period):
+    # stands in for a real sensor, publishes a reading every period seconds
+    while True:
+        coordinator.set_value(this_needle, random.uniform(0, 100))
+        await asyncio.sleep(period)
+
+
+async def main():
+    await asyncio.gather(
+        coordinator.run(),
+        read_sensor(my_needle, 1.0),
+        read_sensor(my_needle2, 0.3),
+    )
+
+
+asyncio.run(main())
@@ -49,12 +49,25 @@ needle_hour = needle(
     needle_pad=30,
     min_value=0,
     max_value=12,
+    value_step=1,  # precompute the 12 hour positions
 )
 needle_min = needle(
-    my_dial, value=0, needle_color=0xFF8000, needle_width=5, min_value=0, max_value=60
+    my_dial,
+    value=0,
+    needle_color=0xFF8000,
+    needle_width=5,
+    min_value=0,
+    max_value=60,
+    value_step=1,
 )
 needle_sec = needle(
-    my_dial, value=0, needle_color=0xFFFFFF, needle_width=2, min_value=0, max_value=60
+    my_dial,
+    value=0,
+    needle_color=0xFFFFFF,
+    needle_width=2,
+    min_value=0,
+    max_value=60,
+    value_step=1,
 )
 
 my_group = displayio.Group()
@@ -64,7 +77,8 @@ display.show(my_group)
 
 while True:
     now = time.localtime()
-    needle_hour.value = (now.tm_hour + 7) % 12
-    needle_min.value = (now.tm_min + 30) % 60
-    needle_sec.value = (now.tm_sec + 30) % 60
+    with my_dial:  # move the three needles together
+        needle_hour.value = (now.tm_hour + 7) % 12
+        needle_min.value = (now.tm_min + 30) % 60
+        needle_sec.value = (now.tm_sec + 30) % 60
     display.refresh()
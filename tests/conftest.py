@@ -0,0 +1,17 @@
+# SPDX-FileCopyrightText: 2023 Jose David Montoya
+#
+# SPDX-License-Identifier: MIT
+"""
+The tests run on CPython with the headless backend, installed here before
+any test module imports the widgets.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# pylint: disable=wrong-import-position
+from circuitpython_simple_dial import headless
+
+headless.install()
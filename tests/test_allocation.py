@@ -0,0 +1,45 @@
+# SPDX-FileCopyrightText: 2023 Jose David Montoya
+#
+# SPDX-License-Identifier: MIT
+
+import gc
+import sys
+import pytest
+from circuitpython_simple_dial.simple_dial import Dial
+from circuitpython_simple_dial.dial_needle import needle
+
+UPDATES = 4000
+
+
+def _allocated():
+    # allocation counter of the platform: CPython block count or MicroPython heap
+    if hasattr(sys, "getallocatedblocks"):
+        return sys.getallocatedblocks()
+    return gc.mem_alloc()  # pylint: disable=no-member
+
+
+@pytest.mark.parametrize(
+    "kwargs, values",
+    (
+        ({}, 100),
+        ({"trig_table": True}, 100),
+        ({"fixed_point": True}, 100),
+        ({"max_value": 60, "value_step": 1}, 60),
+    ),
+    ids=("math", "table", "fixed", "step"),
+)
+def test_updates_do_not_allocate(kwargs, values):
+    dial = Dial(width=240, height=240, padding=12)
+    this_needle = needle(dial, **kwargs)
+    gc.collect()
+    gc.disable()
+    try:
+        # the first pass warms up interpreter caches, only the second counts
+        for _ in range(2):
+            before = _allocated()
+            for i in range(UPDATES):
+                this_needle.value = (i % values) + 0.5
+            growth = _allocated() - before
+    finally:
+        gc.enable()
+    assert growth <= 0
@@ -0,0 +1,22 @@
+# SPDX-FileCopyrightText: 2023 Jose David Montoya
+#
+# SPDX-License-Identifier: MIT
+
+import bitmaptools
+import displayio
+import pytest
+from circuitpython_simple_dial.simple_dial import _draw_circle_spans
+
+
+def _pixels(bitmap):
+    return [bitmap[x, y] for y in range(bitmap.height) for x in range(bitmap.width)]
+
+
+@pytest.mark.parametrize("radius", list(range(60)) + [100, 199, 200, 400])
+def test_spans_match_draw_circle(radius):
+    size = 2 * radius + 3
+    expected = displayio.Bitmap(size, size, 2)
+    bitmaptools.draw_circle(expected, radius + 1, radius + 1, radius, 1)
+    spans = displayio.Bitmap(size, size, 2)
+    _draw_circle_spans(spans, radius + 1, radius + 1, radius, 1)
+    assert _pixels(spans) == _pixels(expected)
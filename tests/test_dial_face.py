@@ -0,0 +1,165 @@
+# SPDX-FileCopyrightText: 2023 Jose David Montoya
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+from circuitpython_simple_dial import headless
+from circuitpython_simple_dial.simple_dial import Dial
+from circuitpython_simple_dial.dial_needle import needle
+
+SIZE = 150
+TICK_STYLES = ("rotozoom", "polygon")
+
+
+def _frame(dial):
+    # the colors a display would show, the face under the needles
+    frame = headless.render(dial, SIZE, SIZE, background=0x102030)
+    return [frame[x, y] for y in range(SIZE) for x in range(SIZE)]
+
+
+def _dial(**kwargs):
+    return Dial(x=0, y=0, width=SIZE, height=SIZE, padding=12, **kwargs)
+
+
+@pytest.mark.parametrize("share_face", (False, True))
+@pytest.mark.parametrize("tick_style", TICK_STYLES)
+def test_lazy_matches_eager(share_face, tick_style):
+    eager = _dial(tick_style=tick_style, share_face=share_face)
+    needle(eager, value=30)
+    lazy = _dial(tick_style=tick_style, share_face=share_face, lazy=True)
+    needle(lazy, value=30)  # added before the face exists
+    assert not lazy.is_rendered
+    lazy.render()
+    assert lazy.is_rendered
+    assert _frame(lazy) == _frame(eager)
+    eager.deinit()
+    lazy.deinit()
+
+
+@pytest.mark.parametrize("tick_style", TICK_STYLES)
+def test_steps_match_one_shot(tick_style):
+    expected = _frame(_dial(tick_style=tick_style))
+    stepped = _dial(tick_style=tick_style, lazy=True)
+    steps = 0
+    for _ in stepped.render_steps(tick_batch=3):
+        steps += 1
+        assert not stepped.is_rendered  # no half-drawn face on display
+    assert steps > 1
+    assert stepped.is_rendered
+    assert _frame(stepped) == expected
+
+
+@pytest.mark.parametrize("tick_style", TICK_STYLES)
+def test_slices_match_one_shot(tick_style):
+    expected = _frame(_dial(tick_style=tick_style))
+    sliced = _dial(tick_style=tick_style, lazy=True)
+    slices = 1
+    while not sliced.render_slice(budget=0):
+        slices += 1
+    assert slices > 1
+    assert _frame(sliced) == expected
+
+    resumed = _dial(tick_style=tick_style, lazy=True)
+    assert not resumed.render_slice(budget=0)
+    assert not resumed.render_slice(budget=0)
+    resumed.render()
+    assert _frame(resumed) == expected
+
+
+CHANGES = (
+    ("tick_color", 0xFF0000),
+    ("tick_label_color", 0x00FF00),
+    ("background_color", 0x000080),
+    ("major_ticks", 7),
+    ("minor_ticks", 1),
+    ("major_tick_labels", ("lo", "", "", "", "hi")),
+    ("minor_tick_labels", ("1", "2", "3", "4") * 4),
+    ("tick_label_scale", 1.5),
+)
+
+
+@pytest.mark.parametrize("name, value", CHANGES)
+@pytest.mark.parametrize("tick_style", TICK_STYLES)
+def test_setter_matches_fresh_dial(tick_style, name, value):
+    dial = _dial(tick_style=tick_style)
+    original = _frame(dial)
+    setattr(dial, name, value)
+    expected = _frame(_dial(tick_style=tick_style, **{name: value}))
+    assert expected != original
+    assert _frame(dial) == expected
+
+
+@pytest.mark.parametrize("share_face", (False, True))
+@pytest.mark.parametrize("name, value", CHANGES)
+def test_lazy_setter_matches_fresh(name, value, share_face):
+    dial = _dial(lazy=True, share_face=share_face)
+    setattr(dial, name, value)
+    dial.render()
+    expected = _dial(share_face=share_face, **{name: value})
+    assert dial.dial_bitmap.bits_per_value == expected.dial_bitmap.bits_per_value
+    assert _frame(dial) == _frame(expected)
+    dial.deinit()
+    expected.deinit()
+
+
+def test_batched_matches_fresh_dial():
+    dial = _dial()
+    this_needle = needle(dial, value=10)
+    with dial:
+        for name, value in CHANGES:
+            setattr(dial, name, value)
+        this_needle.value = 60
+    expected = _dial(**dict(CHANGES))
+    needle(expected, value=60)
+    assert _frame(dial) == _frame(expected)
+
+
+@pytest.mark.parametrize("name, value", (CHANGES[0], CHANGES[3]))
+def test_shared_face_copy_on_write(name, value):
+    original = _frame(_dial())
+    changed = _frame(_dial(**{name: value}))
+    first = _dial(share_face=True)
+    second = _dial(share_face=True)
+    setattr(first, name, value)
+    assert _frame(first) == changed
+    assert _frame(second) == original
+    first.deinit()
+    second.deinit()
+
+
+def _lit(dial):
+    bitmap = dial.dial_bitmap
+    return [
+        bitmap[x, y] != 0 for y in range(bitmap.height) for x in range(bitmap.width)
+    ]
+
+
+@pytest.mark.parametrize("tick_style", TICK_STYLES)
+def test_one_bit_face_same_pixels(tick_style):
+    two_bits = _dial(tick_style=tick_style, tick_color=0xFF0000)
+    one_bit = _dial(tick_style=tick_style)
+    monochrome = _dial(tick_style=tick_style, tick_color=0xFF0000, monochrome=True)
+    assert two_bits.dial_bitmap.bits_per_value == 2
+    assert len(two_bits.dial_palette) == 4
+    for dial in (one_bit, monochrome):
+        assert dial.dial_bitmap.bits_per_value == 1
+        assert len(dial.dial_palette) == 2
+        assert _lit(dial) == _lit(two_bits)
+
+
+def test_face_bytes():
+    assert _dial(tick_color=0xFF0000).face_bytes == SIZE * SIZE * 2 // 8
+    assert _dial().face_bytes == (SIZE * SIZE + 7) // 8
+
+
+@pytest.mark.parametrize("tick_style", TICK_STYLES)
+def test_depth_change_matches_fresh(tick_style):
+    dial = _dial(tick_style=tick_style)
+    dial.tick_color = 0xFF0000
+    assert dial.dial_bitmap.bits_per_value == 2
+    assert _frame(dial) == _frame(_dial(tick_style=tick_style, tick_color=0xFF0000))
+    dial.tick_label_color = 0xFF0000
+    assert dial.dial_bitmap.bits_per_value == 1
+    assert _frame(dial) == _frame(
+        _dial(tick_style=tick_style, tick_color=0xFF0000, tick_label_color=0xFF0000)
+    )
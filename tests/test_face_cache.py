@@ -0,0 +1,73 @@
+# SPDX-FileCopyrightText: 2023 Jose David Montoya
+#
+# SPDX-License-Identifier: MIT
+
+import io
+import bitmaptools
+import pytest
+from circuitpython_simple_dial.simple_dial import Dial
+from circuitpython_simple_dial import face_cache
+
+# pylint: disable=protected-access
+
+
+def _pixels(bitmap):
+    return [bitmap[x, y] for y in range(bitmap.height) for x in range(bitmap.width)]
+
+
+@pytest.mark.parametrize("readinto", (True, False))
+@pytest.mark.parametrize("tick_color", (None, 0x00FF00))
+def test_face_round_trip(tmp_path, monkeypatch, readinto, tick_color):
+    if not readinto:
+        monkeypatch.delattr(bitmaptools, "readinto")
+    kwargs = {"width": 101, "height": 101, "padding": 10}
+    if tick_color is not None:
+        kwargs["tick_color"] = tick_color
+    rendered = Dial(face_cache=str(tmp_path), **kwargs)
+    assert len(list(tmp_path.iterdir())) == 1
+    monkeypatch.setattr(Dial, "_draw_face", _no_drawing)
+    loaded = Dial(face_cache=str(tmp_path), **kwargs)
+    assert _pixels(loaded.dial_bitmap) == _pixels(rendered.dial_bitmap)
+
+
+def _no_drawing(dial, tick_batch):
+    raise AssertionError("the face should be loaded, not drawn")
+
+
+@pytest.mark.parametrize("readinto", (True, False))
+def test_truncated_face_drawn_again(tmp_path, monkeypatch, readinto):
+    if not readinto:
+        monkeypatch.delattr(bitmaptools, "readinto")
+    kwargs = {"width": 101, "height": 101, "padding": 10}
+    rendered = Dial(face_cache=str(tmp_path), **kwargs)
+    (path,) = tmp_path.iterdir()
+    data = path.read_bytes()
+    path.write_bytes(data[: len(data) // 2])  # a reset during save_face
+    redrawn = Dial(face_cache=str(tmp_path), **kwargs)
+    assert _pixels(redrawn.dial_bitmap) == _pixels(rendered.dial_bitmap)
+    assert path.read_bytes() == data
+    assert list(tmp_path.iterdir()) == [path]
+
+
+class _Font:
+    # a loaded font of a given size, as adafruit_bitmap_font keeps them
+    def __init__(self, data):
+        self.file = io.BytesIO(data)
+        self.ascent = 10
+        self.descent = 2
+
+    @staticmethod
+    def get_bounding_box():
+        return (6, 12, 0, -2)
+
+
+def test_fonts_of_same_size_differ():
+    first = _Font(b"STARTFONT 2.1\nFONT -Misc-Fixed-Medium\n")
+    second = _Font(b"STARTFONT 2.1\nFONT -Misc-Fixed-Bold\n")
+    assert face_cache._font_id(first) != face_cache._font_id(second)
+    assert face_cache._font_id(first) == face_cache._font_id(
+        _Font(b"STARTFONT 2.1\nFONT -Misc-Fixed-Medium\n")
+    )
+    first.file.seek(7)
+    face_cache._font_id(first)
+    assert first.file.tell() == 7
@@ -0,0 +1,80 @@
+# SPDX-FileCopyrightText: 2023 Jose David Montoya
+#
+# SPDX-License-Identifier: MIT
+
+from circuitpython_simple_dial.simple_dial import Dial
+from circuitpython_simple_dial.dial_needle import needle
+from circuitpython_simple_dial import needle_animation
+from circuitpython_simple_dial.needle_animation import NeedleAnimator, linear
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _animator(**kwargs):
+    clock = Clock()
+    this_needle = needle(Dial(width=150, height=150, padding=12))
+    return NeedleAnimator(this_needle, clock=clock, **kwargs), this_needle, clock
+
+
+def test_animation_reaches_target():
+    animator, this_needle, clock = _animator(frame_rate=10, easing=linear)
+    animator.animate_to(50, duration=1.0)
+    clock.now = 0.5
+    assert animator.update()
+    assert this_needle.value == 25
+    clock.now = 1.0
+    assert animator.update()
+    assert this_needle.value == 50
+    assert not animator.animating
+    assert not animator.update()
+
+
+def test_updates_follow_frame_rate():
+    animator, _, clock = _animator(frame_rate=10)
+    animator.animate_to(50, duration=1.0)
+    clock.now = 0.01
+    assert animator.update()
+    clock.now = 0.05
+    assert not animator.update()
+    clock.now = 0.35
+    assert animator.update()
+    assert animator.dropped_frames == 2
+
+
+def test_idle_time_is_not_dropped():
+    animator, _, clock = _animator(frame_rate=20)
+    animator.animate_to(50, duration=0.5)
+    while animator.animating:
+        clock.now += 0.05
+        animator.update()
+    dropped = animator.dropped_frames
+    clock.now += 60
+    animator.animate_to(0, duration=0.5)
+    clock.now += 0.05
+    assert animator.update()
+    assert animator.dropped_frames == dropped
+
+
+def test_default_clock_counts_ticks(monkeypatch):
+    # a day and more of nanoseconds, past what a 30 bit float resolves
+    clock = Clock()
+    clock.now = 2**50
+    monkeypatch.setattr(needle_animation, "ticks", clock)
+    monkeypatch.setattr(needle_animation, "TICKS_PER_SECOND", 1000000000)
+    this_needle = needle(Dial(width=150, height=150, padding=12))
+    animator = NeedleAnimator(this_needle, frame_rate=10, easing=linear)
+    animator.animate_to(50, duration=1.0)
+    clock.now += 500000000
+    assert animator.update()
+    assert this_needle.value == 25
+    clock.now += 50000000
+    assert not animator.update()
+    clock.now += 450000000
+    assert animator.update()
+    assert not animator.animating
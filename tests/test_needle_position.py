@@ -0,0 +1,128 @@
+# SPDX-FileCopyrightText: 2023 Jose David Montoya
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+from circuitpython_simple_dial.simple_dial import Dial
+from circuitpython_simple_dial.dial_needle import needle
+
+PATHS = ({}, {"trig_table": True}, {"fixed_point": True})
+
+
+def _needle(**kwargs):
+    # a needle on a dial of its own, and its polygon
+    dial = Dial(width=150, height=150, padding=12)
+    this_needle = needle(dial, **kwargs)
+    return this_needle, dial[len(dial) - 1]
+
+
+def _points_at(position, **kwargs):
+    # on the 0 to 1 range the value is the position itself
+    return _needle(min_value=0.0, max_value=1.0, value=position, **kwargs)[1].points
+
+
+def _tip(points):
+    return points[2]
+
+
+def test_position_directions():
+    center_x, center_y = 75, 75
+    tip_x, tip_y = _tip(_points_at(0.0))
+    assert abs(tip_x - center_x) <= 2 and tip_y > center_y
+    tip_x, tip_y = _tip(_points_at(0.25))
+    assert tip_x < center_x and abs(tip_y - center_y) <= 2
+    tip_x, tip_y = _tip(_points_at(0.5))
+    assert abs(tip_x - center_x) <= 2 and tip_y < center_y
+    tip_x, tip_y = _tip(_points_at(0.75))
+    assert tip_x > center_x and abs(tip_y - center_y) <= 2
+
+
+@pytest.mark.parametrize("path", PATHS)
+@pytest.mark.parametrize(
+    "min_value, max_value, value, position",
+    (
+        (-50, 50, -50, 0.0),
+        (-50, 50, 0, 0.5),
+        (-50, 50, 25, 0.75),
+        (-100, -20, -60, 0.5),
+        (-40, -20, -35, 0.25),
+        (20, 70, 45, 0.5),
+    ),
+)
+def test_negative_and_offset_ranges(min_value, max_value, value, position, path):
+    _, polygon = _needle(min_value=min_value, max_value=max_value, value=value, **path)
+    assert polygon.points == _points_at(position, **path)
+
+
+@pytest.mark.parametrize("path", PATHS)
+@pytest.mark.parametrize(
+    "min_value, max_value, value, position",
+    (
+        (100, 0, 100, 0.0),
+        (100, 0, 75, 0.25),
+        (100, 0, 25, 0.75),
+        (0, -60, -15, 0.25),
+        (50, -50, 0, 0.5),
+    ),
+)
+def test_inverted_ranges(min_value, max_value, value, position, path):
+    _, polygon = _needle(min_value=min_value, max_value=max_value, value=value, **path)
+    assert polygon.points == _points_at(position, **path)
+
+
+@pytest.mark.parametrize("path", PATHS)
+@pytest.mark.parametrize(
+    "min_value, max_value, value, position",
+    (
+        (0, 100, 125, 1.0),
+        (0, 100, -25, 0.0),
+        (-50, 50, 80, 1.0),
+        (100, 0, 130, 0.0),
+        (100, 0, -30, 1.0),
+    ),
+)
+def test_limited_rotation_clamps(min_value, max_value, value, position, path):
+    this_needle, polygon = _needle(min_value=min_value, max_value=max_value, **path)
+    this_needle.value = value
+    assert this_needle.value == value
+    assert polygon.points == _points_at(position, **path)
+
+
+# the wrapped positions are off the axes, where a corner on an exact half
+# pixel could round either way after a full turn
+@pytest.mark.parametrize("path", PATHS)
+@pytest.mark.parametrize(
+    "min_value, max_value, value, position",
+    (
+        (0, 100, 130, 0.3),
+        (0, 100, -30, 0.7),
+        (0, 60, 78, 0.3),
+        (-50, 50, 80, 0.3),
+        (-50, 50, -120, 0.3),
+        (100, 0, 130, 0.7),
+        (0, 100, 360, 0.6),
+    ),
+)
+def test_unlimited_rotation_wraps(min_value, max_value, value, position, path):
+    this_needle, polygon = _needle(
+        min_value=min_value, max_value=max_value, limit_rotation=False, **path
+    )
+    this_needle.value = value
+    assert polygon.points == _points_at(position, **path)
+
+
+def test_range_change_remaps():
+    this_needle, polygon = _needle(value=0)
+    this_needle.min_value = -100
+    assert polygon.points == _points_at(0.5)
+    this_needle.max_value = 300
+    assert polygon.points == _points_at(0.25)
+
+
+def test_empty_range_is_rejected():
+    with pytest.raises(ValueError):
+        _needle(min_value=10, max_value=10)
+    this_needle, _ = _needle()
+    with pytest.raises(ValueError):
+        this_needle.max_value = 0.0
+    assert this_needle.max_value == 100.0
@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: 2023 Jose David Montoya
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+from circuitpython_simple_dial.simple_dial import Dial
+from circuitpython_simple_dial.dial_needle import needle
+
+
+def _needles(**kwargs):
+    # a discrete needle and a continuous one with the same settings, and
+    # their polygons
+    dial = Dial(width=150, height=150, padding=12)
+    value_step = kwargs.pop("value_step")
+    step_needle = needle(dial, value_step=value_step, **kwargs)
+    step_polygon = dial[len(dial) - 1]
+    continuous_needle = needle(dial, **kwargs)
+    return step_needle, step_polygon, continuous_needle, dial[len(dial) - 1]
+
+
+@pytest.mark.parametrize(
+    "min_value, max_value, value_step",
+    (
+        (0, 12, 1),
+        (0, 60, 1),
+        (0, 10, 2.5),
+        (-30, 30, 5),
+        (100, 0, 10),
+        (0, 1, 0.1),
+    ),
+)
+def test_steps_match_continuous(min_value, max_value, value_step):
+    step_needle, step_polygon, continuous_needle, polygon = _needles(
+        min_value=min_value, max_value=max_value, value_step=value_step
+    )
+    count = round(abs(max_value - min_value) / value_step)
+    direction = 1 if max_value > min_value else -1
+    for index in range(count + 1):
+        value = min_value + direction * index * value_step
+        step_needle.value = value
+        continuous_needle.value = value
+        assert step_polygon.points == polygon.points, value
+
+
+def test_values_round_to_steps():
+    step_needle, step_polygon, continuous_needle, polygon = _needles(
+        max_value=60, value_step=5
+    )
+    for value, nearest in ((7.4, 5), (7.6, 10), (58, 60), (70, 60), (-3, 0)):
+        step_needle.value = value
+        continuous_needle.value = nearest
+        assert step_polygon.points == polygon.points, value
+
+
+def test_unlimited_rotation_wraps():
+    step_needle, step_polygon, continuous_needle, polygon = _needles(
+        max_value=12, value_step=1, limit_rotation=False
+    )
+    for value, wrapped in ((13, 1), (20, 8), (-1, 11), (24, 0)):
+        step_needle.value = value
+        continuous_needle.value = wrapped
+        assert step_polygon.points == polygon.points, value
+
+
+@pytest.mark.parametrize(
+    "min_value, max_value, value_step", ((0, 10, 3), (0, 100, 30), (0, 5, 10))
+)
+def test_steps_must_divide_range(min_value, max_value, value_step):
+    dial = Dial(width=150, height=150, padding=12)
+    with pytest.raises(ValueError):
+        needle(dial, min_value=min_value, max_value=max_value, value_step=value_step)
+
+
+def test_step_table_bytes():
+    step_needle = _needles(max_value=60, value_step=1)[0]
+    assert step_needle.step_table_bytes == 61 * 128
+    step_needle.value_step = None
+    assert step_needle.step_table_bytes == 0
+
+
+def test_rejected_keeps_state():
+    step_needle, step_polygon, fresh_needle, polygon = _needles(
+        max_value=60, value_step=5, value=20
+    )
+    with pytest.raises(ValueError):
+        step_needle.min_value = 3
+    assert step_needle.min_value == 0
+    # pylint: disable=protected-access
+    assert step_needle._value_scale == fresh_needle._value_scale
+    assert step_needle._value_offset == fresh_needle._value_offset
+    step_needle.value = 20
+    fresh_needle.value = 20
+    assert step_polygon.points == polygon.points
@@ -0,0 +1,40 @@
+# SPDX-FileCopyrightText: 2023 Jose David Montoya
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+from circuitpython_simple_dial.simple_dial import Dial
+from circuitpython_simple_dial.sprite_needle import sprite_needle
+
+
+def _dial(size=150):
+    return Dial(width=size, height=size, padding=12, lazy=True)
+
+
+def test_steps_get_own_frames():
+    clock = sprite_needle(_dial(), max_value=12, value_step=1)
+    assert clock.frames == 12
+    minutes = sprite_needle(_dial(), max_value=60, value_step=1, memory_budget=65536)
+    assert minutes.frames == 60
+
+
+@pytest.mark.parametrize("memory_budget", (4096, 16384))
+def test_steps_keep_to_budget(memory_budget):
+    minutes = sprite_needle(
+        _dial(240), max_value=60, value_step=1, memory_budget=memory_budget
+    )
+    assert minutes.sheet_bytes <= memory_budget
+    assert minutes.frames < 60
+
+
+def test_budget_too_small():
+    with pytest.raises(ValueError):
+        sprite_needle(_dial(), memory_budget=100)
+    with pytest.raises(ValueError):
+        sprite_needle(_dial(), max_value=12, value_step=1, memory_budget=100)
+
+
+def test_frames_override_budget():
+    needle = sprite_needle(_dial(), frames=64, memory_budget=100)
+    assert needle.frames == 64
+    assert needle.sheet_bytes > 100
@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2023 Jose David Montoya
+#
+# SPDX-License-Identifier: MIT
+
+import os
+import random
+import pytest
+from circuitpython_simple_dial.simple_dial import Dial
+from circuitpython_simple_dial.dial_needle import needle
+from circuitpython_simple_dial import trig_table
+
+# pylint: disable=protected-access, too-few-public-methods
+
+
+@pytest.mark.parametrize("path", ({"trig_table": True}, {"fixed_point": True}))
+@pytest.mark.parametrize("size", (60, 150, 240, 320))
+@pytest.mark.parametrize("needle_width", (1, 3, 4))
+@pytest.mark.parametrize("needle_full", (False, True))
+def test_same_points_as_math(path, size, needle_width, needle_full):
+    dial = Dial(width=size, height=size, padding=12, lazy=True)
+    kwargs = {"needle_width": needle_width, "needle_full": needle_full}
+    math_needle = needle(dial, fixed_point=False, **kwargs)
+    table_needle = needle(dial, **path, **kwargs)
+    positions = random.Random(size * 10 + needle_width)
+    for _ in range(1000):
+        position = positions.random()
+        math_needle._compute_points(position, math_needle._points)
+        table_needle._compute_points(position, table_needle._points)
+        assert table_needle._points == math_needle._points
+
+
+@pytest.mark.parametrize("path", ({"trig_table": True}, {"fixed_point": True}))
+def test_any_turn_same_points(path):
+    # positions beyond the range, as unlimited rotation needles give
+    dial = Dial(width=240, height=240, padding=12, lazy=True)
+    math_needle = needle(dial)
+    table_needle = needle(dial, **path)
+    positions = random.Random(7)
+    for _ in range(1000):
+        position = positions.uniform(-3.0, 4.0)
+        math_needle._compute_points(position, math_needle._points)
+        table_needle._compute_points(position, table_needle._points)
+        assert table_needle._points == math_needle._points
+
+
+def test_fixed_point_off_by_default(monkeypatch):
+    monkeypatch.setattr(trig_table, "SOFT_FLOAT", True)
+    dial = Dial(width=150, height=150, padding=12, lazy=True)
+    assert needle(dial)._trig_table is None
+
+
+class _Uname:
+    def __init__(self, machine):
+        self.machine = machine
+
+
+@pytest.mark.parametrize(
+    "machine, soft_float",
+    (
+        ("Adafruit Feather ESP32-S2 with ESP32S2", True),
+        ("Raspberry Pi Pico with rp2040", True),
+        ("Adafruit QT Py ESP32C3 with ESP32-C3FN4", True),
+        ("Adafruit Feather ESP32-S3 with ESP32S3", False),
+        ("Adafruit PyPortal with samd51j20", False),
+    ),
+)
+def test_soft_float_chips(monkeypatch, machine, soft_float):
+    monkeypatch.setattr(os, "uname", lambda: _Uname(machine), raising=False)
+    assert trig_table._soft_float() is soft_float